@@ -5,8 +5,9 @@ Tüm ayarları burada yapılandırın
 
 import os
 import sys
+import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict
 
 
 class AppConfig:
@@ -26,19 +27,124 @@ class AppConfig:
     text_color = "white"
     wrap_length = 850
     
+    terminal_max_lines = 500  # Ana penceredeki log kutusunda tutulan satır sayısı
+    animation_idle_timeout = 30.0  # Etkileşim/çeviri olmadan bu kadar saniye sonra animasyonlar durur
+    
     # --- FONT AYARLARI ---
     font_name = "Segoe UI"
     font_size = 20
     
     # --- OCR AYARLARI ---
     ocr_interval = 0.3  # Saniye cinsinden
-    sentence_pause_threshold = 1.0  # Cümle bitişi için bekleme süresi
+    sentence_pause_threshold = 1.0  # Cümle bitişi için bekleme süresi (diğer sinyaller gelmezse)
+    commit_terminal_punctuation = (".", "?", "!", "…", "。", "？", "！", '."', '?"', '!"')
+    commit_stable_frames = 2  # Noktalamayla biten metnin gönderilmesi için aynı kalması gereken kare sayısı
+    commit_clear_frames = 1  # Bölge bu kadar kare boş kalırsa biriken metin hemen gönderilir
     contrast_level = 2.5
     brightness_level = 1.0
     
+    # --- OCR PROFİLİ (Tesseract parametreleri, --tune-ocr ile ayarlanır) ---
+    ocr_psm = 3  # Sayfa bölümleme modu (3 = Tesseract varsayılanı)
+    ocr_oem = 3  # Motor modu (3 = varsayılan, 1 = sadece LSTM)
+    ocr_tessdata_dir: Optional[str] = None  # Örn: tessdata_fast dizini
+    ocr_whitelist = ""  # Boş = tüm karakterler
+    ocr_scale = 1.0  # OCR öncesi ölçekleme katsayısı
+    ocr_profile_file = "ocr_profile.json"
+    ocr_auto_scale = True  # Bölgeyi yazı yüksekliğine göre otomatik ölçekle (ocr_scale içeren profil yüklenince kapanır)
+    ocr_target_x_height = 20  # Tesseract için hedef küçük harf yüksekliği (piksel)
+    ocr_min_scale = 0.25
+    ocr_max_scale = 4.0
+    ocr_scale_tolerance = 0.15  # Bu oranın altındaki ölçek farkları yok sayılır
+    ocr_parallel_lines = True  # Çok satırlı bölgeleri satır satır paralel OCR'la
+    ocr_line_psm = 7  # Tek satır sayfa bölümleme modu
+    ocr_workers = 0  # Satır OCR iş parçacığı sayısı (0 = çekirdek sayısı)
+    
+    # --- RENK ANAHTARI (altyazı rengine göre arka plan temizleme) ---
+    ocr_color_key = False
+    color_key_clusters = 16  # Bölge renklerinin indirgeneceği küme sayısı
+    color_key_tolerance = 60  # Kanal başına izin verilen renk farkı
+    color_key_min_coverage = 0.01  # Yazı kümesinin bölgedeki en az payı
+    color_key_max_coverage = 0.4  # Yazı kümesinin bölgedeki en fazla payı
+    color_key_min_text_luminance = 150  # Beyaz/sarı yazı için en düşük parlaklık
+    color_key_outline_radius = 2  # Yazı pikselinin kontura uzaklık sınırı (piksel)
+    color_key_relearn_frames = 30  # Renk anahtarı bu kadar ardışık boş/aşırı dolu maskeden sonra bırakılıp yeniden öğrenilir
+    color_key_max_text_saturation = 40  # Beyaz yazı için kanallar arası en büyük fark
+    color_key_min_adjacency = 0.3  # Yazı kümesi piksellerinin kontura komşu olması gereken en az oran
+    color_key_verify_similarity = 0.6  # Maskeli OCR ile klasik OCR metni arasındaki en düşük benzerlik
+    color_key_verify_every = 50  # Anahtar bu kadar karede bir klasik zincirle yeniden doğrulanır
+    ocr_tessdata_candidates = []  # Ayar sırasında denenecek ek model dizinleri (tessdata_fast vb.)
+    ocr_tune_psm_values = [3, 6, 7]
+    ocr_tune_oem_values = [1, 3]
+    ocr_tune_scales = [0.5, 0.75, 1.0, 1.5]
+    ocr_tune_cer_tolerance = 0.02  # En iyi CER'e göre kabul edilebilir fark
+    
     # --- ÇEVİRİ AYARLARI ---
     source_language = 'en'
     target_language = 'tr'
+    language_id_enabled = True  # Çeviri öncesi yerel dil tanıma
+    language_id_min_confidence = 0.9  # Atlama/otomatik kaynak kararı için en az güven
+    auto_detect_source = False  # Kaynak dili cümle bazında otomatik belirle
+    extra_target_languages = []  # Aynı cümlenin eşzamanlı çevrileceği ek hedef diller (örn: ['en', 'de'])
+    translation_cache_size = 512  # Paylaşılan çeviri önbelleği kapasitesi
+    translate_requests_per_second = 5.0  # Sağlayıcıya saniyede en fazla istek (0 = sınırsız)
+    translate_chars_per_minute = 0  # Dakikada en fazla karakter (0 = sınırsız)
+    translate_workers = 4  # Aynı anda uçuşta olabilecek istek sayısı
+    translate_max_retries = 2  # Başarısız isteğin yeniden deneme sayısı
+    translate_retry_backoff = 0.5  # İlk yeniden deneme gecikmesi (saniye, her denemede iki katına çıkar)
+    speculative_enabled = True  # Kararlı metni gönderimden önce çevirmeye başla
+    speculative_window = 0.25  # Spekülatif çeviri için metnin değişmeden kalması gereken süre (saniye)
+    speculative_waste_budget = 20  # Dakikada en fazla boşa gidebilecek spekülatif çeviri çağrısı
+    
+    # --- ÇIKTI HEDEFLERİ ---
+    output_file_path = "nexus_live.txt"  # Dosya hedefinin yazdığı dosya
+    output_queue_size = 64  # Dosya hedefi kuyruk kapasitesi
+    keystroke_interval = 0.01  # Tuş vuruşları arası bekleme (saniye)
+    output_close_timeout = 2.0  # Durdururken bekleyen çıktıların teslimi için en fazla bekleme (saniye)
+    
+    # --- CANLI YAYIN SUNUCUSU ---
+    stream_enabled = False
+    stream_ws_port = 8765  # localhost WebSocket portu (0 = kapalı)
+    stream_unix_path = "/tmp/nexus_stream.sock"  # Unix soketi (boş = kapalı, Windows'ta yok sayılır)
+    stream_replay_size = 1000  # since=N ile tekrar oynatılabilecek son mesaj sayısı
+    stream_client_queue = 256  # Abone başına bekleyen mesaj sınırı (aşılırsa bağlantı kesilir)
+    stream_allowed_origins = []  # WebSocket'e bağlanabilecek tarayıcı kökenleri (örn: "http://localhost:8000")
+    
+    # --- EK YAKALAMA OTURUMLARI ---
+    # Ana bölgeyle aynı anda çalışan bağımsız oturumlar (ortak OCR havuzu ve çeviri zamanlayıcısı), örn:
+    # [{"name": "oyun", "region": [0, 900, 1920, 150], "source_language": "en", "target_language": "tr",
+    #   "overlay_geometry": "900x150+400+650"}]
+    capture_sessions = []
+    session_stop_timeout = 2.0  # Durdurmada oturum iş parçacıklarının çıkması için beklenen süre (saniye)
+    
+    # --- MOTOR ---
+    engine_mode = "thread"  # "thread" = GUI ile aynı süreç, "process" = ayrı motor süreci
+    engine_max_restarts = 3  # Çöken motor sürecinin en fazla yeniden başlatılma sayısı
+    engine_poll_interval_ms = 50  # GUI'nin motor sonuçlarını okuma aralığı
+    
+    # --- PROFİLLEYİCİ (Ctrl+Shift+P) ---
+    profiler_interval = 0.005  # Yığın örnekleme aralığı (saniye)
+    profiler_top_n = 25  # Özet dosyasındaki fonksiyon sayısı
+    
+    # --- KARE KAYDI (--replay ile tekrar oynatılır) ---
+    record_frames = False  # Yakalanan kareleri kaydet
+    record_dir = "recordings"
+    record_max_mb = 200  # Kayıt dosyası başına boyut sınırı
+    
+    # --- DAYANIKLILIK TESTİ (--soak) ---
+    soak_frame_interval = 0.05  # Kareler arası bekleme (saniye)
+    soak_frames_per_line = 8  # Sentetik altyazının ekranda kaldığı kare sayısı
+    soak_translate_delay = 0.05  # Yerel çevirmenin yapay gecikmesi (saniye)
+    soak_sample_interval = 10.0  # Örnekleme aralığı (saniye)
+    soak_rss_budget_mb = 50.0  # İlk döngüden sonra izin verilen RSS büyümesi
+    soak_heap_budget_mb = 10.0  # İlk döngüden sonra izin verilen Python heap büyümesi (tracemalloc)
+    soak_thread_budget = 2  # Durdurmalar arasında biriken iş parçacığı sınırı
+    soak_latency_drift = 1.5  # Aşama p95 gecikmesinin ilk döngüye göre en fazla katı
+    
+    # --- GEÇMİŞ ---
+    history_segment_max_entries = 5000  # Geçmiş segmenti bu kadar kayıtta (veya gün değişince) sıkıştırılır
+    analytics_minute_retention = 1440  # Tutulan dakika kovası sayısı (son 24 saat)
+    analytics_hour_retention = 2160  # Tutulan saat kovası sayısı (son 90 gün)
+    analytics_save_every = 20  # Analitik toplamlar bu kadar çeviride bir diske yazılır
     
     # --- TEMA AYARLARI (v18.0+) ---
     available_themes = {
@@ -114,6 +220,40 @@ class AppConfig:
         # Hiçbiri bulunamadıysa None döndür
         return None
     
+    @classmethod
+    def load_ocr_profile(cls) -> bool:
+        """Kaydedilmiş OCR profilini (varsa) yapılandırmaya uygula"""
+        profile_path = cls.get_project_root() / cls.ocr_profile_file
+        if not profile_path.exists():
+            return False
+        
+        try:
+            with open(profile_path, 'r', encoding='utf-8') as f:
+                profile = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        for key in ("ocr_psm", "ocr_oem", "ocr_tessdata_dir", "ocr_whitelist", "ocr_scale"):
+            if key in profile:
+                setattr(cls, key, profile[key])
+        if "ocr_scale" in profile:
+            # Profil bu ölçekte ayarlandı: otomatik ölçekleme PSM/OEM seçimini geçersiz kılmasın
+            cls.ocr_auto_scale = False
+        return True
+    
+    @classmethod
+    def save_ocr_profile(cls, profile: Dict) -> Path:
+        """OCR profilini yapılandırmaya uygula ve diske kaydet"""
+        for key, value in profile.items():
+            setattr(cls, key, value)
+        if "ocr_scale" in profile:
+            cls.ocr_auto_scale = False
+        
+        profile_path = cls.get_project_root() / cls.ocr_profile_file
+        with open(profile_path, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, ensure_ascii=False, indent=2)
+        return profile_path
+    
     @staticmethod
     def get_project_root() -> Path:
         """Proje kök dizinini döndür"""
@@ -6,21 +6,41 @@ Geliştirilmiş versiyon: Animasyonlu arayüz, renkli temalar, live istatistikle
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
+import abc
 import threading
 import time
 import os
 import sys
 import logging
 import json
+import gzip
+import math
+import multiprocessing
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import difflib
+import queue
+import re
+import socket
+import struct
+import subprocess
+import tempfile
+import tracemalloc
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Tuple, List, Dict
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse, parse_qs
 import keyboard
 import random
 
 import pyautogui
 import pygetwindow as gw
-from PIL import Image, ImageOps, ImageEnhance
+from PIL import Image, ImageOps, ImageEnhance, ImageChops, ImageFilter, ImageDraw, ImageFont
 from deep_translator import GoogleTranslator
 
 try:
@@ -90,12 +110,151 @@ class AnimationManager:
         return themes.get(theme, themes["neon"])
 
 
+class AnimationScheduler:
+    """Tüm arayüz animasyonlarını tek bir Tk zamanlayıcısından süren merkezi kare zamanlayıcısı"""
+    
+    def __init__(self, root: tk.Misc, idle_timeout: float = 30.0):
+        self.root = root
+        self.idle_timeout = idle_timeout
+        # ad -> {"callback", "interval", "owner", "next_due", "step"}
+        self._animations: Dict[str, Dict] = {}
+        self._after_id: Optional[str] = None
+        self._obscured = set()
+        self._last_activity = time.monotonic()
+        self.stats = {"ticks": 0, "reconfigures": 0, "cpu_time": 0.0}
+        self._started = time.monotonic()
+    
+    def register(self, name: str, callback, interval_ms: int, owner: Optional[tk.Misc] = None) -> None:
+        """
+        Animasyon kaydet
+        
+        callback(step) -> [(widget, {configure argümanları}), ...]
+        owner görünür değilken (gizli/simge durumunda) animasyon durur.
+        """
+        self._animations[name] = {
+            "callback": callback,
+            "interval": interval_ms / 1000,
+            "owner": owner,
+            "next_due": time.monotonic(),
+            "step": 0,
+        }
+        if owner is not None:
+            owner.bind("<Map>", lambda e: self.wake(), add="+")
+            owner.bind("<Unmap>", lambda e: self.wake(), add="+")
+            owner.bind("<Visibility>", lambda e, o=owner: self._on_visibility(o, e), add="+")
+        self.wake()
+    
+    def _on_visibility(self, owner: tk.Misc, event) -> None:
+        """Pencere başka bir pencerenin (oyunun) altında tamamen kaldı mı?"""
+        if event.widget is not owner:
+            return
+        if str(event.state) == "VisibilityFullyObscured":
+            self._obscured.add(owner)
+        else:
+            self._obscured.discard(owner)
+        self.wake()
+    
+    def unregister(self, name: str) -> None:
+        """Animasyonu kaldır"""
+        self._animations.pop(name, None)
+    
+    def poke(self) -> None:
+        """Kullanıcı etkinliği veya yeni çeviri: boşta kalma sayacını sıfırla"""
+        self._last_activity = time.monotonic()
+        if self._after_id is None:
+            self.wake()
+    
+    def wake(self) -> None:
+        """Zamanlayıcıyı yeniden planla (ana döngüye aktar)"""
+        try:
+            self.root.after(0, self._reschedule)
+        except Exception:
+            pass
+    
+    def _is_visible(self, animation: Dict) -> bool:
+        """Animasyonun sahibi ekranda görünür mü?"""
+        owner = animation["owner"]
+        if owner is None:
+            return True
+        if owner in self._obscured:
+            return False
+        try:
+            if not owner.winfo_exists() or not owner.winfo_viewable():
+                return False
+            return owner.state() != "iconic" if hasattr(owner, "state") else True
+        except Exception:
+            return False
+    
+    def _active(self) -> List[Dict]:
+        """Şu anda çalışması gereken animasyonlar"""
+        if time.monotonic() - self._last_activity > self.idle_timeout:
+            return []
+        return [a for a in self._animations.values() if self._is_visible(a)]
+    
+    def _reschedule(self) -> None:
+        """Bir sonraki tick'i en yakın animasyona göre kur; aktif animasyon yoksa uyanma"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        
+        active = self._active()
+        if not active:
+            return
+        delay = max(0.0, min(a["next_due"] for a in active) - time.monotonic())
+        self._after_id = self.root.after(math.ceil(delay * 1000), self._tick)
+    
+    def _tick(self) -> None:
+        """Zamanı gelen animasyonları çalıştır, widget güncellemelerini toplu uygula"""
+        self._after_id = None
+        cpu_start = time.thread_time()
+        # Aynı tick'e denk gelen animasyonları birlikte çalıştırmak için küçük tolerans
+        now = time.monotonic() + 0.005
+        
+        updates: Dict[tk.Misc, Dict] = {}
+        for name, animation in list(self._animations.items()):
+            if animation["next_due"] > now or not self._is_visible(animation):
+                continue
+            try:
+                for widget, options in animation["callback"](animation["step"]) or []:
+                    updates.setdefault(widget, {}).update(options)
+            except Exception as e:
+                logger.warning(f"Animasyon hatası ({name}): {e}")
+                self.unregister(name)
+                continue
+            animation["step"] += 1
+            animation["next_due"] = now + animation["interval"]
+        
+        # Aynı widget'a gelen değişiklikler tek configure çağrısında birleşir
+        for widget, options in updates.items():
+            try:
+                widget.configure(**options)
+                self.stats["reconfigures"] += 1
+            except Exception as e:
+                logger.warning(f"Animasyon güncelleme hatası: {e}")
+        
+        self.stats["ticks"] += 1
+        self.stats["cpu_time"] += time.thread_time() - cpu_start
+        self._reschedule()
+    
+    def report(self) -> str:
+        """Zamanlayıcının kendi maliyetini özetle"""
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        ticks = self.stats["ticks"]
+        cpu_ms = self.stats["cpu_time"] * 1000
+        return (f"{ticks} tick ({ticks / elapsed:.2f}/sn), {self.stats['reconfigures']} güncelleme, "
+                f"CPU {cpu_ms:.1f} ms (tick başına {cpu_ms / max(ticks, 1):.3f} ms)")
+
+
 class TesseractManager:
     """Tesseract OCR yönetimi (platform uyumlu)"""
     
     def __init__(self, config: AppConfig):
         self.config = config
         self.available = False
+        self._pending: "OrderedDict[str, deque]" = OrderedDict()  # Oturum → bekleyen OCR işleri
+        self._workers: List[threading.Thread] = []
+        self._cond = threading.Condition()
+        self._generation = 0  # Kapatılan havuzun iş parçacıkları yeni havuza karışmasın
         self.initialize()
     
     def initialize(self) -> bool:
@@ -121,210 +280,2971 @@ class TesseractManager:
             logger.error(f"Tesseract başlatma hatası: {e}")
             return False
     
-    def extract_text(self, image: Image.Image, language: str = 'eng') -> str:
-        """Görüntüden metin çıkart"""
-        if not self.available:
-            logger.warning("Tesseract kullanılamıyor")
-            return ""
+    def build_config(self, psm: Optional[int] = None, oem: Optional[int] = None,
+                     tessdata_dir: Optional[str] = None, whitelist: Optional[str] = None) -> str:
+        """Tesseract komut satırı parametrelerini OCR profilinden oluştur"""
+        psm = self.config.ocr_psm if psm is None else psm
+        oem = self.config.ocr_oem if oem is None else oem
+        tessdata_dir = self.config.ocr_tessdata_dir if tessdata_dir is None else tessdata_dir
+        whitelist = self.config.ocr_whitelist if whitelist is None else whitelist
+        
+        parts = [f"--psm {psm}", f"--oem {oem}"]
+        if tessdata_dir:
+            parts.append(f'--tessdata-dir "{tessdata_dir}"')
+        whitelist = self.sanitize_whitelist(whitelist)
+        if whitelist:
+            parts.append(f"-c tessedit_char_whitelist={whitelist}")
+        return " ".join(parts)
+    
+    @staticmethod
+    def sanitize_whitelist(whitelist: str) -> str:
+        """Beyaz listeden boşluk, tırnak ve ters bölüyü at (pytesseract parametreleri shlex ile böler)"""
+        return "".join(c for c in whitelist or "" if not c.isspace() and c not in "'\"\\`")
+    
+    def extract_text(self, image: Image.Image, language: str = 'eng', tess_config: Optional[str] = None) -> str:
+        """Görüntüden metin çıkart"""
+        if not self.available:
+            logger.warning("Tesseract kullanılamıyor")
+            return ""
+        
+        try:
+            if tess_config is None:
+                tess_config = self.build_config()
+            return pytesseract.image_to_string(image, lang=language, config=tess_config).strip()
+        except Exception as e:
+            logger.error(f"OCR hatası: {e}")
+            return ""
+    
+    def submit(self, image: Image.Image, language: str = 'eng', tess_config: Optional[str] = None,
+               session: str = "") -> Future:
+        """OCR işini ortak havuza ekle (oturumlar arasında sırayla dağıtılır)"""
+        future: Future = Future()
+        with self._cond:
+            if not self._workers:
+                # pytesseract her çağrıda ayrı süreç başlattığından iş parçacıkları çekirdeklere dağılır
+                workers = self.config.ocr_workers or os.cpu_count() or 2
+                self._workers = [threading.Thread(target=self._work, args=(self._generation,), name=f"ocr-{i}", daemon=True)
+                                 for i in range(workers)]
+                for worker in self._workers:
+                    worker.start()
+            self._pending.setdefault(session, deque()).append((future, image, language, tess_config))
+            self._cond.notify()
+        return future
+    
+    def _work(self, generation: int) -> None:
+        """Oturumları sırayla (round-robin) dolaşarak OCR işlerini çalıştır"""
+        while True:
+            with self._cond:
+                while not self._pending and generation == self._generation:
+                    self._cond.wait()
+                if generation != self._generation:
+                    return
+                session, tasks = next(iter(self._pending.items()))
+                future, image, language, tess_config = tasks.popleft()
+                if tasks:
+                    self._pending.move_to_end(session)
+                else:
+                    del self._pending[session]
+            if future.set_running_or_notify_cancel():
+                future.set_result(self.extract_text(image, language, tess_config))
+    
+    def extract_lines_parallel(self, line_images: List[Image.Image], language: str = 'eng', session: str = "") -> str:
+        """Satır görüntülerini ortak havuzda paralel OCR'la ve sırasıyla birleştir
+        
+        Tek görüntü (bölünemeyen bölge) tüm kare olarak varsayılan profille OCR'lanır.
+        """
+        if not line_images:
+            return ""
+        tess_config = self.build_config(psm=self.config.ocr_line_psm) if len(line_images) > 1 else None
+        futures = [self.submit(line, language, tess_config, session) for line in line_images]
+        texts = [future.result() for future in futures]
+        return "\n".join(text for text in texts if text)
+    
+    def shutdown(self) -> None:
+        """OCR iş havuzunu kapat"""
+        with self._cond:
+            self._generation += 1
+            pending = [task for tasks in self._pending.values() for task in tasks]
+            self._pending.clear()
+            self._workers = []
+            self._cond.notify_all()
+        for future, *_ in pending:
+            future.cancel()
+
+
+class OCRBenchmark:
+    """Etiketli örnek kareler üzerinde OCR hız/doğruluk ölçümü"""
+    
+    IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp")
+    
+    @staticmethod
+    def load_samples(sample_dir: str) -> List[Tuple[Image.Image, str]]:
+        """Örnek kareleri ve doğru metinleri yükle (kare.png + kare.txt)"""
+        samples = []
+        for image_path in sorted(Path(sample_dir).iterdir()):
+            if image_path.suffix.lower() not in OCRBenchmark.IMAGE_SUFFIXES:
+                continue
+            truth_path = image_path.with_suffix(".txt")
+            if not truth_path.exists():
+                logger.warning(f"Doğru metin bulunamadı, atlandı: {image_path.name}")
+                continue
+            image = Image.open(image_path)
+            image.load()
+            samples.append((image, truth_path.read_text(encoding='utf-8').strip()))
+        return samples
+    
+    @staticmethod
+    def character_error_rate(reference: str, hypothesis: str) -> float:
+        """Karakter hata oranı (Levenshtein mesafesi / referans uzunluğu)"""
+        reference = " ".join(reference.split())
+        hypothesis = " ".join(hypothesis.split())
+        if not reference:
+            return 0.0 if not hypothesis else 1.0
+        
+        previous = list(range(len(hypothesis) + 1))
+        for i, ref_char in enumerate(reference, 1):
+            current = [i]
+            for j, hyp_char in enumerate(hypothesis, 1):
+                current.append(min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_char != hyp_char)
+                ))
+            previous = current
+        return previous[-1] / len(reference)
+    
+    @staticmethod
+    def evaluate(samples: List[Tuple[Image.Image, str]], pipeline) -> Dict[str, float]:
+        """pipeline(image) -> metin fonksiyonunu tüm örneklerde ölç"""
+        latencies = []
+        errors = []
+        for image, truth in samples:
+            start = time.perf_counter()
+            text = pipeline(image)
+            latencies.append(time.perf_counter() - start)
+            errors.append(OCRBenchmark.character_error_rate(truth, text))
+        
+        count = max(len(samples), 1)
+        return {
+            "latency_ms": sum(latencies) / count * 1000,
+            "cer": sum(errors) / count,
+        }
+
+
+class OCRProfileTuner:
+    """Tesseract PSM/OEM/model/ölçek kombinasyonlarını tarayıp en iyi profili seçer"""
+    
+    def __init__(self, config: AppConfig, tesseract_mgr: TesseractManager):
+        self.config = config
+        self.tesseract_mgr = tesseract_mgr
+    
+    def _candidates(self, samples: List[Tuple[Image.Image, str]]) -> List[Dict]:
+        """Denenecek profil kombinasyonlarını üret"""
+        model_dirs = [None] + list(self.config.ocr_tessdata_candidates)
+        
+        # Doğru metinlerdeki karakterlerden beyaz liste türet (yalnızca verilen örneklerden)
+        charset = TesseractManager.sanitize_whitelist("".join(sorted({c for _, truth in samples for c in truth})))
+        whitelists = [""]
+        if charset:
+            whitelists.append(charset)
+        
+        candidates = []
+        for psm in self.config.ocr_tune_psm_values:
+            for oem in self.config.ocr_tune_oem_values:
+                for model_dir in model_dirs:
+                    for scale in self.config.ocr_tune_scales:
+                        for whitelist in whitelists:
+                            candidates.append({
+                                "ocr_psm": psm,
+                                "ocr_oem": oem,
+                                "ocr_tessdata_dir": model_dir,
+                                "ocr_whitelist": whitelist,
+                                "ocr_scale": scale,
+                            })
+        return candidates
+    
+    def _pipeline(self, profile: Dict):
+        """Verilen profil için OCR fonksiyonu oluştur"""
+        tess_config = self.tesseract_mgr.build_config(
+            psm=profile["ocr_psm"],
+            oem=profile["ocr_oem"],
+            tessdata_dir=profile["ocr_tessdata_dir"] or "",
+            whitelist=profile["ocr_whitelist"]
+        )
+        
+        def run(image: Image.Image) -> str:
+            image = ImageProcessor.scale(image, profile["ocr_scale"])
+            return self.tesseract_mgr.extract_text(image, tess_config=tess_config)
+        return run
+    
+    def tune(self, samples: List[Tuple[Image.Image, str]]) -> Optional[Dict]:
+        """Tüm kombinasyonları ölç, CER toleransı içindeki en hızlı profili döndür"""
+        if not samples or not self.tesseract_mgr.available:
+            logger.error("OCR ayarı için örnek kare veya Tesseract yok")
+            return None
+        
+        # Örnekleri canlı döngüdeki gibi ön işle
+        prepared = [(ImageProcessor.prepare_for_ocr(image, self.config), truth) for image, truth in samples]
+        
+        # Beyaz liste örneklerin yarısından türetilir, diğer yarıda kazanırsa kaydedilir
+        fitting, held_out = prepared[::2], prepared[1::2]
+        
+        results = []
+        for profile in self._candidates(fitting if held_out else []):
+            metrics = OCRBenchmark.evaluate(prepared, self._pipeline(profile))
+            results.append((profile, metrics))
+            logger.info(
+                f"[OCR AYAR] psm={profile['ocr_psm']} oem={profile['ocr_oem']} "
+                f"model={profile['ocr_tessdata_dir'] or 'varsayılan'} ölçek={profile['ocr_scale']} "
+                f"beyaz_liste={'evet' if profile['ocr_whitelist'] else 'hayır'} -> "
+                f"{metrics['latency_ms']:.1f} ms, CER={metrics['cer']:.3f}"
+            )
+        
+        best_cer = min(metrics["cer"] for _, metrics in results)
+        eligible = [r for r in results if r[1]["cer"] <= best_cer + self.config.ocr_tune_cer_tolerance]
+        profile, metrics = min(eligible, key=lambda r: r[1]["latency_ms"])
+        
+        if profile["ocr_whitelist"]:
+            without = {**profile, "ocr_whitelist": ""}
+            held_with = OCRBenchmark.evaluate(held_out, self._pipeline(profile))
+            held_without = OCRBenchmark.evaluate(held_out, self._pipeline(without))
+            logger.info(f"[OCR AYAR] Ayrılmış örneklerde beyaz liste CER={held_with['cer']:.3f}, "
+                        f"beyaz listesiz CER={held_without['cer']:.3f}")
+            if held_with["cer"] >= held_without["cer"]:
+                profile = without
+                metrics = next(m for p, m in results if p == without)
+        
+        logger.info(f"[OCR AYAR] Kazanan profil: {profile} ({metrics['latency_ms']:.1f} ms, CER={metrics['cer']:.3f})")
+        return profile
+
+
+class ImageProcessor:
+    """Görüntü işleme işlemleri"""
+    
+    def __init__(self):
+        # Yazı yüksekliğine göre hesaplanan ölçek, bölge düzeni değişene kadar saklanır
+        self._scale_cache: Optional[Tuple[Tuple[int, int], float]] = None
+        # Bölgeden öğrenilen altyazı yazı/kontur renkleri
+        self.color_key: Optional[Dict[str, Optional[Tuple[int, int, int]]]] = None
+        self._empty_masks = 0
+        self._keyed_frames = 0
+        self._relearn_wait = 0
+        self.last_keyed = False
+    
+    @staticmethod
+    def prepare_for_ocr(image: Image.Image, config: AppConfig) -> Image.Image:
+        """OCR için görüntüyü optimize et"""
+        try:
+            # Gri tonlamaya dönüştür ve ters çevir
+            image = ImageOps.invert(ImageOps.grayscale(image))
+            
+            # Kontrastı artır
+            enhancer = ImageEnhance.Contrast(image)
+            image = enhancer.enhance(config.contrast_level)
+            
+            # Parlaklığı ayarla
+            brightness_enhancer = ImageEnhance.Brightness(image)
+            image = brightness_enhancer.enhance(config.brightness_level)
+            
+            return image
+        except Exception as e:
+            logger.error(f"Görüntü işleme hatası: {e}")
+            return image
+    
+    @staticmethod
+    def scale(image: Image.Image, factor: float) -> Image.Image:
+        """Görüntüyü verilen katsayıyla yeniden örnekle"""
+        if factor == 1.0:
+            return image
+        width = max(1, int(image.width * factor))
+        height = max(1, int(image.height * factor))
+        resample = Image.LANCZOS if factor > 1.0 else Image.BOX
+        return image.resize((width, height), resample)
+    
+    @staticmethod
+    def ink_row_profile(image: Image.Image) -> List[float]:
+        """Her satırdaki yazı (mürekkep) piksel oranını döndür"""
+        gray = ImageOps.grayscale(image)
+        histogram = gray.histogram()
+        total = gray.width * gray.height
+        threshold = sum(i * count for i, count in enumerate(histogram)) / max(total, 1)
+        
+        # Azınlıkta kalan ton yazı kabul edilir (açık zemin/koyu yazı veya tersi)
+        dark_pixels = sum(histogram[:int(threshold)])
+        if dark_pixels <= total / 2:
+            ink = gray.point(lambda v: 255 if v < threshold else 0)
+        else:
+            ink = gray.point(lambda v: 255 if v >= threshold else 0)
+        
+        # Tek sütuna BOX ile küçültmek satır ortalamalarını C tarafında hesaplar
+        column = ink.resize((1, gray.height), Image.BOX)
+        return [value / 255 for value in column.getdata()]
+    
+    @staticmethod
+    def find_text_lines(profile: List[float], min_ink_ratio: float = 0.05) -> List[Tuple[int, int]]:
+        """Yatay izdüşümden yazı satırlarını (başlangıç, bitiş) olarak bul
+        
+        Eşik izdüşümün tepe değerine göredir: geniş bölgedeki kısa bir satır da tek bant olarak bulunur.
+        """
+        peak = max(profile, default=0.0)
+        if peak <= 0:
+            return []
+        min_ink = peak * min_ink_ratio
+        lines = []
+        start = None
+        for row, value in enumerate(profile):
+            if value > min_ink and start is None:
+                start = row
+            elif value <= min_ink and start is not None:
+                lines.append((start, row))
+                start = None
+        if start is not None:
+            lines.append((start, len(profile)))
+        return [(top, bottom) for top, bottom in lines if bottom - top >= 3]
+    
+    @staticmethod
+    def split_lines(image: Image.Image) -> List[Image.Image]:
+        """Yatay izdüşümle görüntüyü yazı satırlarına böl (0/1 satırda görüntünün tamamı döner)"""
+        lines = ImageProcessor.find_text_lines(ImageProcessor.ink_row_profile(image))
+        if len(lines) <= 1:
+            return [image]
+        
+        # Dar boşlukla ayrılmış bantları ve nokta/şapka gibi ince bantları komşu satırla birleştir
+        heights = sorted(bottom - top for top, bottom in lines)
+        median_height = heights[len(heights) // 2]
+        merged: List[List[int]] = []
+        for top, bottom in lines:
+            if merged and (top - merged[-1][1] < median_height * 0.5
+                           or bottom - top < median_height * 0.4
+                           or merged[-1][1] - merged[-1][0] < median_height * 0.4):
+                merged[-1][1] = bottom
+            else:
+                merged.append([top, bottom])
+        if len(merged) <= 1:
+            return [image]
+        
+        crops = []
+        for top, bottom in merged:
+            padding = max(2, (bottom - top) // 4)
+            crops.append(image.crop((0, max(0, top - padding), image.width, min(image.height, bottom + padding))))
+        return crops
+    
+    @staticmethod
+    def estimate_x_height(image: Image.Image) -> Optional[float]:
+        """Satır izdüşümlerinden ortanca x-yüksekliğini tahmin et"""
+        profile = ImageProcessor.ink_row_profile(image)
+        heights = []
+        for top, bottom in ImageProcessor.find_text_lines(profile):
+            band = profile[top:bottom]
+            peak = max(band)
+            # Küçük harf gövdesi satırın en yoğun bandıdır; uzantılar daha seyrektir
+            heights.append(sum(1 for value in band if value >= peak * 0.5))
+        if not heights:
+            return None
+        heights.sort()
+        return float(heights[len(heights) // 2])
+    
+    def scale_for_ocr(self, image: Image.Image, config: AppConfig) -> Image.Image:
+        """Görüntüyü Tesseract'ın ideal yazı yüksekliğine ölçekle"""
+        if not config.ocr_auto_scale:
+            return self.scale(image, config.ocr_scale)
+        
+        if self._scale_cache is None or self._scale_cache[0] != image.size:
+            x_height = self.estimate_x_height(image)
+            if x_height is None:
+                # Yazı yok: düzen bilinmiyor, önbelleğe alma
+                return image
+            factor = config.ocr_target_x_height / x_height
+            factor = min(max(factor, config.ocr_min_scale), config.ocr_max_scale)
+            if abs(factor - 1.0) < config.ocr_scale_tolerance:
+                factor = 1.0
+            self._scale_cache = (image.size, factor)
+            logger.info(f"[OCR] x-yüksekliği {x_height:.0f}px, ölçek katsayısı {factor:.2f}")
+        
+        return self.scale(image, self._scale_cache[1])
+    
+    def reset_layout(self) -> None:
+        """Bölge düzeni değişti: ölçek önbelleğini ve renk anahtarını temizle"""
+        self._scale_cache = None
+        self.color_key = None
+        self._empty_masks = 0
+        self._keyed_frames = 0
+        self._relearn_wait = 0
+    
+    @staticmethod
+    def _luminance(color: Tuple[int, int, int]) -> float:
+        """Algısal parlaklık (0-255)"""
+        r, g, b = color[:3]
+        return 0.299 * r + 0.587 * g + 0.114 * b
+    
+    @staticmethod
+    def _is_text_color(color: Tuple[int, int, int], config: AppConfig) -> bool:
+        """Altyazı yazısı olabilecek renk mi? (parlak beyaz ya da doygun sarı)"""
+        r, g, b = color[:3]
+        if ImageProcessor._luminance(color) < config.color_key_min_text_luminance:
+            return False
+        white = max(r, g, b) - min(r, g, b) <= config.color_key_max_text_saturation
+        yellow = abs(r - g) <= 60 and b <= 0.6 * min(r, g)
+        return white or yellow
+    
+    @staticmethod
+    def learn_color_key(image: Image.Image, config: AppConfig) -> Optional[Dict[str, Optional[Tuple[int, int, int]]]]:
+        """Bölgedeki baskın renklerden altyazı yazı ve kontur rengini öğren
+        
+        Yazı kümesi beyaz/sarı olmalı ve koyu bir kontur kümesine komşu olmalıdır; bitki örtüsü,
+        gökyüzü veya patlama renkleri aday sayılmaz. Uygun küme yoksa None döner.
+        """
+        rgb = image.convert("RGB")
+        quantized = rgb.quantize(colors=config.color_key_clusters, method=Image.Quantize.MEDIANCUT)
+        palette = quantized.getpalette()
+        total = rgb.width * rgb.height
+        clusters = []
+        for count, index in quantized.getcolors(config.color_key_clusters) or []:
+            color = tuple(palette[index * 3:index * 3 + 3])
+            clusters.append((count / total, color, index))
+        if len(clusters) < 2:
+            return None
+        
+        # En yaygın küme arka plandır; kontur en koyu kümedir
+        clusters.sort(reverse=True)
+        outline = None
+        darker = [c for c in clusters[1:] if c[0] >= config.color_key_min_coverage / 2]
+        if darker:
+            outline = min(darker, key=lambda c: ImageProcessor._luminance(c[1]))
+        
+        candidates = [
+            c for c in clusters[1:]
+            if config.color_key_min_coverage <= c[0] <= config.color_key_max_coverage
+            and c is not outline
+            and ImageProcessor._is_text_color(c[1], config)
+        ]
+        if not candidates:
+            return None
+        
+        if outline and ImageProcessor._luminance(outline[1]) > config.color_key_min_text_luminance - 100:
+            outline = None
+        if outline is None:
+            _, text_color, _ = max(candidates, key=lambda c: ImageProcessor._luminance(c[1]))
+            return {"text": text_color, "outline": None}
+        
+        # Yazı kümesi koyu kontura komşu olmalı (birden fazla parlak küme varsa en komşu olan seçilir)
+        size = config.color_key_outline_radius * 2 + 1
+        near_outline = quantized.point(lambda i: 255 if i == outline[2] else 0, "L").filter(ImageFilter.MaxFilter(size))
+        
+        def adjacency(cluster) -> float:
+            cluster_mask = quantized.point(lambda i: 255 if i == cluster[2] else 0, "L")
+            touching = ImageChops.multiply(cluster_mask, near_outline).histogram()[255]
+            return touching / max(cluster_mask.histogram()[255], 1)
+        
+        best = max(candidates, key=adjacency)
+        if adjacency(best) < config.color_key_min_adjacency:
+            return None
+        return {"text": best[1], "outline": outline[1]}
+    
+    @staticmethod
+    def _color_distance_mask(image: Image.Image, color: Tuple[int, int, int], tolerance: int) -> Image.Image:
+        """Renge yakın pikseller 255, diğerleri 0 (kanal başına en büyük fark)"""
+        diff = ImageChops.difference(image, Image.new("RGB", image.size, color))
+        r, g, b = diff.split()
+        distance = ImageChops.lighter(ImageChops.lighter(r, g), b)
+        return distance.point(lambda v: 255 if v <= tolerance else 0)
+    
+    @staticmethod
+    def color_key_mask(image: Image.Image, key: Dict, config: AppConfig) -> Image.Image:
+        """Renk anahtarıyla temiz ikili maske üret (beyaz zemin, siyah yazı)"""
+        rgb = image.convert("RGB")
+        mask = ImageProcessor._color_distance_mask(rgb, key["text"], config.color_key_tolerance)
+        
+        if key.get("outline"):
+            # Yalnızca koyu kontura komşu yazı renkli pikseller (patlama, gökyüzü vb. elenir)
+            outline = ImageProcessor._color_distance_mask(rgb, key["outline"], config.color_key_tolerance)
+            size = config.color_key_outline_radius * 2 + 1
+            seed = ImageChops.multiply(mask, outline.filter(ImageFilter.MaxFilter(size)))
+            # Kalın harflerin iç kısmını geri kazanmak için tohum maskeyi yazı içinde büyüt
+            for _ in range(2):
+                seed = ImageChops.multiply(mask, seed.filter(ImageFilter.MaxFilter(size)))
+            mask = seed
+        
+        return ImageOps.invert(mask)
+    
+    def learn_key(self, image: Image.Image, config: AppConfig) -> bool:
+        """Renk anahtarını bu kareden öğren (klasik ön işlemeyle yazı bulunan kareler için çağrılır)
+        
+        Reddedilen veya öğrenilemeyen anahtardan sonra color_key_relearn_frames kare beklenir.
+        """
+        if self._relearn_wait > 0:
+            self._relearn_wait -= 1
+            return False
+        self.color_key = self.learn_color_key(image, config)
+        self._empty_masks = 0
+        self._keyed_frames = 0
+        if self.color_key is None:
+            self._relearn_wait = config.color_key_relearn_frames
+            return False
+        logger.info(f"[OCR] Renk anahtarı öğrenildi: yazı={self.color_key['text']} kontur={self.color_key['outline']}")
+        return True
+    
+    def reject_key(self, config: AppConfig, reason: str) -> None:
+        """Güvenilmeyen anahtarı bırak; bir süre klasik zincirle devam et"""
+        logger.info(f"[OCR] Renk anahtarı bırakıldı ({reason})")
+        self.color_key = None
+        self._empty_masks = 0
+        self._keyed_frames = 0
+        self._relearn_wait = config.color_key_relearn_frames
+    
+    def needs_verification(self, config: AppConfig) -> bool:
+        """Son kare maskeyle işlendiyse ve doğrulama sırası geldiyse True"""
+        return self.last_keyed and self._keyed_frames % config.color_key_verify_every == 0
+    
+    def prepare(self, image: Image.Image, config: AppConfig, color_key: bool = False) -> Image.Image:
+        """Seçili moda göre OCR ön işlemesi (renk anahtarı veya klasik zincir)
+        
+        Anahtar yokken klasik zincir kullanılır; anahtar learn_key() ile öğrenilir. Maskenin yazı
+        payı beklenen aralığın dışındaysa o kare klasik zincirle işlenir; bu ardışık
+        color_key_relearn_frames kare sürerse anahtar bırakılır.
+        """
+        self.last_keyed = False
+        if color_key and self.color_key:
+            try:
+                mask = self.color_key_mask(image, self.color_key, config)
+            except Exception as e:
+                logger.error(f"Renk anahtarı hatası: {e}")
+                return self.prepare_for_ocr(image, config)
+            
+            share = mask.histogram()[0] / (mask.width * mask.height)
+            if config.color_key_min_coverage / 10 <= share <= config.color_key_max_coverage:
+                self._empty_masks = 0
+                self._keyed_frames += 1
+                self.last_keyed = True
+                return mask
+            
+            self._empty_masks += 1
+            if self._empty_masks >= config.color_key_relearn_frames:
+                self.reject_key(config, f"{self._empty_masks} karedir maske yazı payı {share:.3f}")
+        return self.prepare_for_ocr(image, config)
+
+
+class LanguageDetector:
+    """Ağ gerektirmeyen karakter n-gram tabanlı dil tanıma"""
+    
+    # Latin alfabeli diller için örnek diyalog metinleri (trigram profilleri buradan çıkarılır)
+    SEED_TEXTS = {
+        "en": "what are you doing here? i think we should go now. the people in the city are waiting for us. "
+              "there is no time left, you have to trust me. where is the key? this is the only way out of here. "
+              "they will come back and they will find us. thank you for everything, i will never forget that. "
+              "okay, let's go. i love you. no, i can't do that. the enemy is coming from the north. "
+              "where are you going? what happened to you? yes, i know, but i am still afraid.",
+        "tr": "burada ne yapıyorsun? bence şimdi gitmeliyiz. şehirdeki insanlar bizi bekliyor. hiç zaman kalmadı, "
+              "bana güvenmek zorundasın. anahtar nerede? buradan çıkmanın tek yolu bu. geri gelecekler ve bizi "
+              "bulacaklar. her şey için teşekkür ederim, bunu asla unutmayacağım. çok güzel bir gün, değil mi? "
+              "tamam, hadi gidelim. seni seviyorum. hayır, onu yapamam. düşman kuzeyden yaklaşıyor. "
+              "nereye gidiyorsun? ne oldu sana? onlar da geliyorlar mı? evet, biliyorum ama yine de korkuyorum.",
+        "fr": "qu'est-ce que tu fais ici? je pense qu'il faut partir maintenant. les gens de la ville nous attendent. "
+              "il n'y a plus de temps, tu dois me faire confiance. où est la clé? c'est le seul moyen de sortir. "
+              "ils vont revenir et ils vont nous trouver. merci pour tout, je ne l'oublierai jamais.",
+        "de": "was machst du hier? ich glaube, wir sollten jetzt gehen. die leute in der stadt warten auf uns. "
+              "es ist keine zeit mehr, du musst mir vertrauen. wo ist der schlüssel? das ist der einzige weg nach "
+              "draußen. sie werden zurückkommen und uns finden. danke für alles, ich werde das nie vergessen.",
+        "es": "¿qué estás haciendo aquí? creo que deberíamos irnos ahora. la gente de la ciudad nos está esperando. "
+              "no queda tiempo, tienes que confiar en mí. ¿dónde está la llave? es la única salida de aquí. "
+              "ellos volverán y nos encontrarán. gracias por todo, nunca lo olvidaré.",
+        "it": "cosa stai facendo qui? penso che dovremmo andare adesso. la gente della città ci sta aspettando. "
+              "non c'è più tempo, devi fidarti di me. dov'è la chiave? questa è l'unica via d'uscita. "
+              "loro torneranno e ci troveranno. grazie di tutto, non lo dimenticherò mai.",
+        "pt": "o que você está fazendo aqui? acho que devemos ir agora. as pessoas da cidade estão esperando por nós. "
+              "não há mais tempo, você tem que confiar em mim. onde está a chave? esta é a única saída daqui. "
+              "eles vão voltar e vão nos encontrar. obrigado por tudo, eu nunca vou esquecer isso.",
+    }
+    
+    # Tek başına güçlü kanıt sayılan dile özgü harfler
+    MARKER_CHARS = {
+        "tr": "ğışİ",
+        "de": "ßä",
+        "es": "ñ¿¡",
+        "pt": "ãõ",
+    }
+    MARKER_BONUS = 6.0
+    
+    def __init__(self):
+        self.profiles: Dict[str, Dict[str, float]] = {}
+        for language, text in self.SEED_TEXTS.items():
+            counts: Dict[str, int] = {}
+            for gram in self._ngrams(text):
+                counts[gram] = counts.get(gram, 0) + 1
+            total = sum(counts.values())
+            vocabulary = len(counts) + 1
+            # Laplace yumuşatmalı log-olasılıklar; görülmemiş n-gram için "_unseen"
+            profile = {gram: math.log((count + 1) / (total + vocabulary)) for gram, count in counts.items()}
+            profile["_unseen"] = math.log(1 / (total + vocabulary))
+            self.profiles[language] = profile
+    
+    @staticmethod
+    def _ngrams(text: str, n: int = 3) -> List[str]:
+        """Kelime sınırlarıyla birlikte karakter trigramları"""
+        grams = []
+        for word in text.lower().split():
+            word = "".join(c for c in word if c.isalpha() or c == "'")
+            if not word:
+                continue
+            padded = f" {word} "
+            grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return grams
+    
+    @staticmethod
+    def _script_language(text: str) -> Optional[str]:
+        """Latin dışı yazı sistemlerini doğrudan karakter aralığından tanı"""
+        counts = {"ja": 0, "ko": 0, "zh": 0, "ru": 0, "latin": 0}
+        for c in text:
+            code = ord(c)
+            if 0x3040 <= code <= 0x30ff:
+                counts["ja"] += 1
+            elif 0xac00 <= code <= 0xd7af or 0x1100 <= code <= 0x11ff:
+                counts["ko"] += 1
+            elif 0x4e00 <= code <= 0x9fff:
+                counts["zh"] += 1
+            elif 0x0400 <= code <= 0x04ff:
+                counts["ru"] += 1
+            elif c.isalpha():
+                counts["latin"] += 1
+        
+        # Kana varsa Kanji'li metin de Japoncadır
+        if counts["ja"]:
+            counts["ja"] += counts["zh"]
+        language = max(counts, key=counts.get)
+        if counts[language] == 0 or language == "latin":
+            return None
+        return language
+    
+    def detect(self, text: str) -> Tuple[Optional[str], float]:
+        """Metnin dilini ve güven değerini (0-1) döndür"""
+        script_language = self._script_language(text)
+        if script_language:
+            return script_language, 1.0
+        
+        grams = self._ngrams(text)
+        if not grams:
+            return None, 0.0
+        
+        scores = {}
+        for language, profile in self.profiles.items():
+            unseen = profile["_unseen"]
+            score = sum(profile.get(gram, unseen) for gram in grams)
+            markers = sum(text.count(c) for c in self.MARKER_CHARS.get(language, ""))
+            scores[language] = (score + markers * self.MARKER_BONUS) / len(grams)
+        
+        # N-gram başına ortalama log-olasılıklardan softmax ile güven
+        best = max(scores.values())
+        weights = {language: math.exp((score - best) * len(grams)) for language, score in scores.items()}
+        total = sum(weights.values())
+        language = max(weights, key=weights.get)
+        return language, weights[language] / total
+
+
+class SubtitleOverlay(tk.Toplevel):
+    """Çeviri sonuçlarını gösteren overlay penceresi (animasyonlu)"""
+    
+    def __init__(self, config: AppConfig, theme: str = "neon", geometry: Optional[str] = None,
+                 language: Optional[str] = None, scheduler: Optional[AnimationScheduler] = None):
+        super().__init__()
+        self.config = config
+        self.theme = theme
+        self.geometry_spec = geometry or config.overlay_geometry
+        self.language = language
+        self.scheduler = scheduler
+        self.colors = AnimationManager.get_theme_colors(theme)
+        self._setup_window()
+        self._setup_ui()
+        self._bind_events()
+        self._start_pulse_animation()
+    
+    def _setup_window(self) -> None:
+        """Pencere özelliklerini yapılandır"""
+        self.overrideredirect(True)
+        self.attributes("-topmost", True, "-alpha", self.config.overlay_alpha)
+        self.configure(bg=self.colors["bg"])
+        self.geometry(self.geometry_spec)
+    
+    def _setup_ui(self) -> None:
+        """UI öğelerini oluştur (animasyonlu sınır)"""
+        # Animasyonlu neon sınır
+        self.border = tk.Frame(self, bg=self.colors["primary"], padx=2, pady=2)
+        self.border.pack(expand=True, fill="both")
+        
+        # İç çerçeve
+        self.inner = tk.Frame(self.border, bg=self.colors["bg"])
+        self.inner.pack(expand=True, fill="both")
+        
+        # Durum etiketi
+        self.status = tk.Label(
+            self.inner,
+            text="◉ HAZIR",
+            font=("Roboto", 10, "bold"),
+            fg=self.colors["accent"],
+            bg=self.colors["bg"]
+        )
+        self.status.pack(anchor="ne", padx=10, pady=5)
+        
+        # Metin etiketi (ana)
+        self.label = tk.Label(
+            self.inner,
+            text="NEXUS AI: Konuşma Bekleniyor...",
+            font=(self.config.font_name, self.config.font_size, "bold"),
+            fg=self.colors["fg"],
+            bg=self.colors["bg"],
+            wraplength=self.config.wrap_length,
+            justify="center"
+        )
+        self.label.pack(expand=True, fill="both", padx=15, pady=15)
+        
+        # Alt bilgi
+        self.info = tk.Label(
+            self.inner,
+            text=f"[{self.language.upper()}] Sürükle: Pencereyi taşı" if self.language else "Sürükle: Pencereyi taşı",
+            font=("Roboto", 8),
+            fg=self.colors["secondary"],
+            bg=self.colors["bg"]
+        )
+        self.info.pack(anchor="s", padx=5, pady=5)
+    
+    def _bind_events(self) -> None:
+        """Olay bağlantılarını ayarla (sürükleme)"""
+        self.bind("<Button-1>", self._start_drag)
+        self.bind("<B1-Motion>", self._drag)
+    
+    def _start_drag(self, event) -> None:
+        """Sürükleme başlat"""
+        self.drag_x = event.x
+        self.drag_y = event.y
+    
+    def _drag(self, event) -> None:
+        """Pencereyi sürükle"""
+        new_x = self.winfo_x() + (event.x - self.drag_x)
+        new_y = self.winfo_y() + (event.y - self.drag_y)
+        self.geometry(f"+{new_x}+{new_y}")
+    
+    def _start_pulse_animation(self) -> None:
+        """Pulse animasyonunu merkezi zamanlayıcıya kaydet"""
+        if self.scheduler:
+            self.scheduler.register(f"overlay-pulse-{id(self)}", self._animate_pulse, 300, owner=self)
+    
+    def _animate_pulse(self, step: int) -> List[Tuple[tk.Misc, Dict]]:
+        """Sınırın renk döngüsündeki bir sonraki rengi"""
+        colors_seq = [
+            self.colors["primary"],
+            self.colors["secondary"],
+            self.colors["accent"],
+            self.colors["primary"]
+        ]
+        return [(self.border, {"bg": colors_seq[step % len(colors_seq)]})]
+    
+    def update_text(self, text: str) -> None:
+        """Gösterilen metni güncelle"""
+        try:
+            self.label.config(text=text, fg=self.colors["fg"])
+            self.status.config(text="✓ ÇEVRILI", fg=self.colors["accent"])
+            self.update()
+            if self.scheduler:
+                self.scheduler.poke()
+        except Exception as e:
+            logger.warning(f"Text update hatası: {e}")
+    
+    def destroy(self) -> None:
+        """Pencereyi kapat ve animasyon kaydını sil"""
+        if self.scheduler:
+            self.scheduler.unregister(f"overlay-pulse-{id(self)}")
+        super().destroy()
+
+
+class HistoryAnalytics:
+    """
+    Çeviri geçmişinin artımlı toplamları
+    
+    Dakika, saat ve gün kovalarında sayı, karakter, gecikme ve önbellek isabeti; dil çifti hacmi ve günün
+    saatlerine göre dağılım her kayıtta O(1) güncellenir, panel okumaları geçmiş boyutundan bağımsızdır.
+    Toplamlar history_dir/analytics.json'a yazılır; geçmişle uyuşmazsa (çökme, taşıma) bir kez yeniden hesaplanır.
+    """
+    
+    def __init__(self, path: Path, minute_retention: int = 1440, hour_retention: int = 2160, save_every: int = 20):
+        self.path = Path(path)
+        self.minute_retention = minute_retention
+        self.hour_retention = hour_retention
+        self.save_every = save_every
+        self._unsaved = 0
+        self.reset()
+    
+    @staticmethod
+    def _bucket() -> Dict:
+        return {"count": 0, "characters": 0, "latency_total": 0.0, "latency_count": 0, "cache_hits": 0}
+    
+    def reset(self) -> None:
+        """Tüm toplamları sıfırla"""
+        self.totals = self._bucket()
+        self.minutes: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hours: "OrderedDict[str, Dict]" = OrderedDict()
+        self.days: "OrderedDict[str, Dict]" = OrderedDict()
+        self.pairs: Dict[str, Dict] = {}
+        self.hour_of_day = [0] * 24
+    
+    @staticmethod
+    def _add(bucket: Dict, characters: int, latency_ms: Optional[float], cache_hit: bool) -> None:
+        bucket["count"] += 1
+        bucket["characters"] += characters
+        if latency_ms is not None:
+            bucket["latency_total"] += latency_ms
+            bucket["latency_count"] += 1
+        bucket["cache_hits"] += int(cache_hit)
+    
+    def _add_to(self, buckets: "OrderedDict[str, Dict]", key: str, retention: Optional[int], *values) -> None:
+        if key not in buckets:
+            buckets[key] = self._bucket()
+            while retention and len(buckets) > retention:
+                buckets.popitem(last=False)
+        self._add(buckets[key], *values)
+    
+    def record(self, entry: Dict) -> None:
+        """Bir geçmiş kaydını tüm toplamlara işle"""
+        timestamp = entry["timestamp"]
+        values = (len(entry["original"]), entry.get("latency_ms"), entry.get("cache_hit", False))
+        self._add(self.totals, *values)
+        self._add_to(self.minutes, timestamp[:16], self.minute_retention, *values)
+        self._add_to(self.hours, timestamp[:13], self.hour_retention, *values)
+        self._add_to(self.days, timestamp[:10], None, *values)
+        pair = self.pairs.setdefault(entry.get("language_pair", "?"), {"count": 0, "characters": 0})
+        pair["count"] += 1
+        pair["characters"] += values[0]
+        self.hour_of_day[int(timestamp[11:13])] += 1
+        
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save()
+    
+    def rebuild(self, entries) -> None:
+        """Toplamları geçmişin tamamından yeniden hesapla (yalnızca uyuşmazlıkta)"""
+        self.reset()
+        save_every, self.save_every = self.save_every, math.inf
+        for entry in entries:
+            self.record(entry)
+        self.save_every = save_every
+        self.save()
+    
+    def save(self) -> None:
+        """Toplamları atomik olarak yaz"""
+        self._unsaved = 0
+        try:
+            temp_file = self.path.with_suffix(".tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "totals": self.totals,
+                    "minutes": self.minutes,
+                    "hours": self.hours,
+                    "days": self.days,
+                    "pairs": self.pairs,
+                    "hour_of_day": self.hour_of_day
+                }, f, ensure_ascii=False)
+            os.replace(temp_file, self.path)
+        except Exception as e:
+            logger.error(f"Analitik kaydetme hatası: {e}")
+    
+    def load(self) -> bool:
+        """Kaydedilmiş toplamları yükle"""
+        self.reset()
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.totals = data["totals"]
+            self.minutes = OrderedDict(data["minutes"])
+            self.hours = OrderedDict(data["hours"])
+            self.days = OrderedDict(data["days"])
+            self.pairs = data["pairs"]
+            self.hour_of_day = data["hour_of_day"]
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Analitik dosyası okunamadı, yeniden hesaplanacak: {e}")
+            self.reset()
+            return False
+    
+    def summary(self) -> Dict:
+        """Panel için özet (geçmiş boyutundan bağımsız)"""
+        totals = self.totals
+        now = datetime.now()
+        last_minute = self.minutes.get(now.strftime("%Y-%m-%dT%H:%M"), {}).get("count", 0)
+        last_hour = self.hours.get(now.strftime("%Y-%m-%dT%H"), {}).get("count", 0)
+        busiest_hour = max(range(24), key=lambda hour: self.hour_of_day[hour]) if totals["count"] else None
+        top_pair = max(self.pairs.items(), key=lambda item: item[1]["count"])[0] if self.pairs else None
+        return {
+            "count": totals["count"],
+            "characters": totals["characters"],
+            "avg_characters": totals["characters"] / totals["count"] if totals["count"] else 0.0,
+            "avg_latency_ms": totals["latency_total"] / totals["latency_count"] if totals["latency_count"] else None,
+            "cache_hit_rate": totals["cache_hits"] / totals["count"] if totals["count"] else 0.0,
+            "this_minute": last_minute,
+            "this_hour": last_hour,
+            "today": self.days.get(now.strftime("%Y-%m-%d"), {}).get("count", 0),
+            "busiest_hour": busiest_hour,
+            "top_pair": top_pair
+        }
+
+
+class TranslationHistory:
+    """
+    Çeviri geçmişi yönetimi (segmentli, sıkıştırılmış arşiv)
+    
+    Yalnızca güncel segment bellekte tutulur ve her kayıtta dosyanın sonuna eklenir.
+    Gün değiştiğinde veya segment dolduğunda gzip'li segmente döndürülür; eski
+    segmentler index.json'daki zaman aralıklarıyla bulunur ve gerektiğinde diskten okunur.
+    """
+    
+    def __init__(self, history_dir: str = "translation_history", segment_max_entries: int = 5000):
+        self.history_dir = Path(history_dir)
+        self.index_file = self.history_dir / "index.json"
+        self.current_file = self.history_dir / "current.jsonl"
+        self.legacy_file = self.history_dir.with_suffix(".json")
+        self.segment_max_entries = segment_max_entries
+        self.history: List[Dict] = []  # Güncel segment
+        self.segments: List[Dict] = []  # {"file", "start", "end", "count", "characters"}
+        self.stats = {"total_translations": 0, "total_characters": 0}
+        self.analytics = HistoryAnalytics(self.history_dir / "analytics.json", AppConfig.analytics_minute_retention,
+                                          AppConfig.analytics_hour_retention, AppConfig.analytics_save_every)
+        self._lock = threading.RLock()
+        self.load()
+    
+    def add(self, original: str, translated: str, language_pair: str,
+            latency: Optional[float] = None, cache_hit: bool = False) -> None:
+        """Çeviriye geçmişe ekle"""
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "original": original,
+            "translated": translated,
+            "language_pair": language_pair
+        }
+        if latency is not None:
+            entry["latency_ms"] = round(latency * 1000, 1)
+        if cache_hit:
+            entry["cache_hit"] = True
+        with self._lock:
+            if self.history and (
+                len(self.history) >= self.segment_max_entries
+                or self.history[0]["timestamp"][:10] != entry["timestamp"][:10]
+            ):
+                self._rotate()
+            
+            self.history.append(entry)
+            self.stats["total_translations"] += 1
+            self.stats["total_characters"] += len(original)
+            self.analytics.record(entry)
+            try:
+                with open(self.current_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except Exception as e:
+                logger.error(f"Geçmiş kaydetme hatası: {e}")
+    
+    def _write_segment(self, entries: List[Dict]) -> None:
+        """Kayıtları gzip'li yeni bir segmente yaz ve indekse ekle"""
+        name = f"segment-{entries[0]['timestamp'][:19].replace(':', '')}-{len(self.segments):05d}.jsonl.gz"
+        with gzip.open(self.history_dir / name, 'wt', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.segments.append({
+            "file": name,
+            "start": entries[0]["timestamp"],
+            "end": entries[-1]["timestamp"],
+            "count": len(entries),
+            "characters": sum(len(entry["original"]) for entry in entries),
+        })
+    
+    def _rotate(self) -> None:
+        """Güncel segmenti sıkıştırıp arşive taşı"""
+        try:
+            self._write_segment(self.history)
+            self._save_index()
+            self.analytics.save()
+            self.current_file.write_text("", encoding='utf-8')
+            self.history = []
+        except Exception as e:
+            logger.error(f"Geçmiş segment döndürme hatası: {e}")
+    
+    def _save_index(self) -> None:
+        """Segment indeksini atomik olarak yaz"""
+        temp_file = self.index_file.with_suffix(".tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"segments": self.segments}, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, self.index_file)
+    
+    def save(self) -> None:
+        """İndeksi ve güncel segmenti kaydet"""
+        with self._lock:
+            try:
+                self.history_dir.mkdir(parents=True, exist_ok=True)
+                self._save_index()
+                with open(self.current_file, 'w', encoding='utf-8') as f:
+                    for entry in self.history:
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self.analytics.save()
+            except Exception as e:
+                logger.error(f"Geçmiş kaydetme hatası: {e}")
+    
+    def load(self) -> None:
+        """İndeksi ve yalnızca güncel segmenti yükle"""
+        with self._lock:
+            try:
+                self.history_dir.mkdir(parents=True, exist_ok=True)
+                if self.index_file.exists():
+                    with open(self.index_file, 'r', encoding='utf-8') as f:
+                        self.segments = json.load(f).get("segments", [])
+                elif self.legacy_file.exists():
+                    self._migrate_legacy()
+                
+                self.history = []
+                if self.current_file.exists():
+                    with open(self.current_file, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            if line.strip():
+                                self.history.append(json.loads(line))
+                
+                self.stats = {
+                    "total_translations": sum(seg["count"] for seg in self.segments) + len(self.history),
+                    "total_characters": sum(seg["characters"] for seg in self.segments)
+                                        + sum(len(entry["original"]) for entry in self.history),
+                }
+                
+                # Analitik toplamlar geçmişle uyuşmuyorsa (çökme, taşıma, eski sürüm) bir kez yeniden hesapla
+                if (not self.analytics.load()
+                        or self.analytics.totals["count"] != self.stats["total_translations"]
+                        or self.analytics.totals["characters"] != self.stats["total_characters"]):
+                    self.analytics.rebuild(self.iter_entries())
+            except Exception as e:
+                logger.error(f"Geçmiş yükleme hatası: {e}")
+    
+    def _migrate_legacy(self) -> None:
+        """Eski tek dosyalı JSON geçmişini günlük segmentlere dönüştür"""
+        with open(self.legacy_file, 'r', encoding='utf-8') as f:
+            entries = json.load(f).get("history", [])
+        
+        day_entries: List[Dict] = []
+        for entry in entries:
+            if day_entries and (
+                day_entries[0]["timestamp"][:10] != entry["timestamp"][:10]
+                or len(day_entries) >= self.segment_max_entries
+            ):
+                self._write_segment(day_entries)
+                day_entries = []
+            day_entries.append(entry)
+        if day_entries:
+            self._write_segment(day_entries)
+        
+        self._save_index()
+        os.replace(self.legacy_file, self.legacy_file.with_suffix(".json.bak"))
+        logger.info(f"Eski geçmiş dosyası {len(self.segments)} segmente dönüştürüldü ({len(entries)} kayıt)")
+    
+    def _read_segment(self, segment: Dict) -> List[Dict]:
+        """Sıkıştırılmış segmenti diskten oku"""
+        with gzip.open(self.history_dir / segment["file"], 'rt', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    
+    def iter_entries(self):
+        """Tüm geçmişi eskiden yeniye diskten akıt (tamamı belleğe alınmaz)"""
+        with self._lock:
+            segments = list(self.segments)
+            current = list(self.history)
+        for segment in segments:
+            yield from self._read_segment(segment)
+        yield from current
+    
+    def export(self, path: str) -> int:
+        """Geçmişi eski JSON biçiminde dışa aktar (akış halinde yazılır)"""
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"history": [')
+            for entry in self.iter_entries():
+                f.write((",\n" if count else "\n") + json.dumps(entry, ensure_ascii=False))
+                count += 1
+            f.write('\n], "stats": ' + json.dumps(self.stats) + "}\n")
+        return count
+    
+    def clear(self) -> None:
+        """Tüm segmentleri ve güncel geçmişi sil"""
+        with self._lock:
+            for segment in self.segments:
+                try:
+                    (self.history_dir / segment["file"]).unlink()
+                except FileNotFoundError:
+                    pass
+            self.segments = []
+            self.history = []
+            self.stats = {"total_translations": 0, "total_characters": 0}
+            self.analytics.reset()
+            self.save()
+    
+    def get_recent(self, limit: int = 10) -> List[Dict]:
+        """Son çevirileri getir (gerekirse eski segmentlerden tamamla)"""
+        with self._lock:
+            recent = self.history[-limit:]
+            segments = list(self.segments)
+        for segment in reversed(segments):
+            if len(recent) >= limit:
+                break
+            recent = self._read_segment(segment)[-(limit - len(recent)):] + recent
+        return recent
+
+
+class OutputSink(abc.ABC):
+    """
+    Çeviriyi kendi iş parçacığında teslim eden çıktı hedefi
+    
+    Kuyruk sınırlıdır; dolduğunda drop_policy'ye göre en eski ("drop_oldest")
+    veya yeni ("drop_newest") öğe atılır, böylece yakalama/OCR döngüsü hiç beklemez.
+    """
+    
+    name = "sink"
+    
+    def __init__(self, max_queue: int = 16, drop_policy: str = "drop_oldest"):
+        self.queue: "queue.Queue[Optional[Dict]]" = queue.Queue(maxsize=max_queue)
+        self.drop_policy = drop_policy
+        self.stats = {"delivered": 0, "dropped": 0, "errors": 0, "latency_total": 0.0, "latency_max": 0.0}
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"sink-{self.name}")
+        self._thread.start()
+    
+    def submit(self, text: str, original: str = "", language: str = "") -> None:
+        """Öğeyi bloklamadan kuyruğa ekle"""
+        item = {"text": text, "original": original, "language": language, "created": time.perf_counter()}
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.stats["dropped"] += 1
+            if self.drop_policy == "drop_oldest":
+                try:
+                    self.queue.get_nowait()
+                    self.queue.put_nowait(item)
+                except (queue.Empty, queue.Full):
+                    pass
+    
+    @abc.abstractmethod
+    def deliver(self, item: Dict) -> None:
+        """Öğeyi hedefe teslim et (alt sınıflar uygular)"""
+    
+    def _run(self) -> None:
+        """Kuyruktan öğe alıp teslim eden iş parçacığı"""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            try:
+                self.deliver(item)
+                latency = time.perf_counter() - item["created"]
+                self.stats["delivered"] += 1
+                self.stats["latency_total"] += latency
+                self.stats["latency_max"] = max(self.stats["latency_max"], latency)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Çıktı hatası ({self.name}): {e}")
+    
+    def close(self, timeout: float = 2.0) -> None:
+        """İş parçacığını durdur: bekleyen öğeler en fazla timeout saniye teslim edilir
+        
+        Hedef bu sürede yer açmazsa kuyrukta kalan öğeler atılır (dropped sayacına eklenir).
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            while True:
+                try:
+                    self.queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        self.queue.get_nowait()
+                        self.stats["dropped"] += 1
+                    except queue.Empty:
+                        pass
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            logger.warning(f"Çıktı hedefi ({self.name}) {timeout:.1f} sn içinde kapanmadı")
+    
+    def report(self) -> str:
+        """Teslim gecikmesi özeti"""
+        delivered = self.stats["delivered"]
+        average = self.stats["latency_total"] / delivered * 1000 if delivered else 0.0
+        return (f"{self.name}: {delivered} teslim, {self.stats['dropped']} atıldı, {self.stats['errors']} hata, "
+                f"ort {average:.1f} ms, en fazla {self.stats['latency_max'] * 1000:.1f} ms")
+
+
+class KeystrokeSink(OutputSink):
+    """Çeviriyi aktif pencereye tuş vuruşlarıyla yazar (eski otomatik kopyala davranışı)"""
+    
+    name = "keystroke"
+    
+    def __init__(self, interval: float = 0.01, **kwargs):
+        self.interval = interval
+        super().__init__(**kwargs)
+    
+    def deliver(self, item: Dict) -> None:
+        pyautogui.write(item["text"], interval=self.interval)
+
+
+class ClipboardSink(OutputSink):
+    """Çeviriyi sistem panosuna kopyalar"""
+    
+    name = "clipboard"
+    
+    def deliver(self, item: Dict) -> None:
+        if sys.platform == "win32":
+            command, encoding = ["clip"], "utf-16le"
+        elif sys.platform == "darwin":
+            command, encoding = ["pbcopy"], "utf-8"
+        elif os.environ.get("WAYLAND_DISPLAY"):
+            command, encoding = ["wl-copy"], "utf-8"
+        else:
+            command, encoding = ["xclip", "-selection", "clipboard"], "utf-8"
+        subprocess.run(command, input=item["text"].encode(encoding), check=True, timeout=5)
+
+
+class FileTailSink(OutputSink):
+    """Her çeviriyi satır olarak dosyanın sonuna ekler (tail -f / OBS metin kaynağı için)"""
+    
+    name = "file"
+    
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        super().__init__(**kwargs)
+    
+    def deliver(self, item: Dict) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(item["text"].replace("\n", " ") + "\n")
+
+
+class OutputSinkManager:
+    """Etkin çıktı hedeflerine dağıtım"""
+    
+    def __init__(self, sinks: Optional[List[OutputSink]] = None):
+        self.sinks: List[OutputSink] = sinks or []
+    
+    def publish(self, text: str, original: str = "", language: str = "") -> None:
+        """Tüm hedeflere bloklamadan gönder"""
+        for sink in self.sinks:
+            sink.submit(text, original, language)
+    
+    def close(self, timeout: float = 2.0) -> List[str]:
+        """Tüm hedefleri kapat (toplam en fazla timeout saniye bekler) ve gecikme raporlarını döndür"""
+        deadline = time.monotonic() + timeout
+        reports = []
+        for sink in self.sinks:
+            sink.close(max(0.0, deadline - time.monotonic()))
+            reports.append(sink.report())
+        self.sinks = []
+        return reports
+
+
+class LiveStreamServer:
+    """
+    Canlı çevirileri yerel abonelere anında iten sunucu
+    
+    localhost WebSocket (ws://127.0.0.1:<port>/?since=N) ve destekleniyorsa Unix soketi
+    (satır başına bir JSON; ilk satırda isteğe bağlı {"since": N}) üzerinden yayın yapar.
+    Kendi asyncio döngüsünde çalışır; publish() işleme döngüsünü bekletmez.
+    """
+    
+    WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+    WS_MAX_CLIENT_PAYLOAD = 125  # Kontrol çerçevesi sınırı (RFC 6455)
+    
+    def __init__(self, config: AppConfig):
+        self.config = config
+        self.sequence = 0
+        self.backlog: deque = deque(maxlen=config.stream_replay_size)
+        self.clients: Dict[int, asyncio.Queue] = {}
+        self.stats = {"published": 0, "disconnected_slow": 0}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._servers: List[asyncio.AbstractServer] = []
+        self._tasks: set = set()
+        self._unix_path: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+    
+    def start(self) -> None:
+        """Sunucuyu ayrı bir iş parçacığında başlat"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="live-stream")
+        self._thread.start()
+        self._ready.wait(timeout=5)
+    
+    def stop(self) -> None:
+        """Dinleyicileri ve tüm bağlantıları kapat, döngüyü durdur ve Unix soketini sil"""
+        if self._loop and self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Canlı yayın sunucusu kapatma hatası: {e}")
+                if self._loop:
+                    self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._thread = None
+    
+    async def _shutdown(self) -> None:
+        """Yeni bağlantıları reddet, abone görevlerini iptal et, sonra döngüyü durdur"""
+        for server in self._servers:
+            server.close()
+        tasks = [task for task in self._tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for server in self._servers:
+            try:
+                await asyncio.wait_for(server.wait_closed(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+        self._servers = []
+        self._loop.call_soon(self._loop.stop)
+    
+    def _run(self) -> None:
+        """asyncio döngüsü (sunucu iş parçacığı)"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._start_servers())
+        except Exception as e:
+            logger.error(f"Canlı yayın sunucusu başlatılamadı: {e}")
+        finally:
+            self._ready.set()
+        
+        try:
+            if self._servers:
+                self._loop.run_forever()
+        finally:
+            for server in self._servers:
+                server.close()
+            self._servers = []
+            if self._unix_path and os.path.exists(self._unix_path):
+                os.unlink(self._unix_path)
+            self._unix_path = None
+            self._loop.close()
+            self._loop = None
+    
+    async def _start_servers(self) -> None:
+        """WebSocket ve Unix soketi dinleyicilerini aç"""
+        if self.config.stream_ws_port:
+            self._servers.append(await asyncio.start_server(self._handle_websocket, "127.0.0.1", self.config.stream_ws_port))
+            logger.info(f"Canlı yayın: ws://127.0.0.1:{self.config.stream_ws_port}/")
+        if self.config.stream_unix_path and hasattr(socket, "AF_UNIX") and sys.platform != "win32":
+            if os.path.exists(self.config.stream_unix_path):
+                os.unlink(self.config.stream_unix_path)
+            self._servers.append(await asyncio.start_unix_server(self._handle_unix, self.config.stream_unix_path))
+            self._unix_path = self.config.stream_unix_path
+            logger.info(f"Canlı yayın: unix:{self.config.stream_unix_path}")
+    
+    def publish(self, original: str, translated: str, language_pair: str) -> None:
+        """Yeni çeviriyi yayınla (herhangi bir iş parçacığından çağrılabilir)"""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._publish, original, translated, language_pair)
+        except RuntimeError:
+            pass
+    
+    def _publish(self, original: str, translated: str, language_pair: str) -> None:
+        """Mesajı sıra numarasıyla arabelleğe al ve abonelerin kuyruğuna ekle"""
+        self.sequence += 1
+        message = json.dumps({
+            "seq": self.sequence,
+            "ts": round(time.time(), 3),
+            "pair": language_pair,
+            "src": original,
+            "dst": translated,
+        }, ensure_ascii=False, separators=(",", ":"))
+        self.backlog.append((self.sequence, message))
+        self.stats["published"] += 1
+        
+        for client_id, client_queue in list(self.clients.items()):
+            try:
+                client_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Yavaş abone: bağlantıyı kes, since=<son seq> ile yeniden bağlanıp telafi eder
+                self.stats["disconnected_slow"] += 1
+                while not client_queue.empty():
+                    client_queue.get_nowait()
+                client_queue.put_nowait(None)
+                self.clients.pop(client_id, None)
+    
+    async def _replay(self, since: int, send) -> None:
+        """since sonrasındaki arabelleği gönder; kaybolan aralık için gap, sıra sıfırlandıysa reset bildir
+        
+        Arabellek gönderim sırasında büyümeye devam eder; abone yetişene kadar tekrar bakılır.
+        """
+        cursor = since
+        if since > self.sequence:
+            # Sunucu yeniden başlatılmış: istemcinin sıra numarası geçersiz
+            await send(json.dumps({"type": "reset", "seq": self.sequence}, separators=(",", ":")))
+            cursor = 0
+        while True:
+            pending = [(sequence, message) for sequence, message in self.backlog if sequence > cursor]
+            if not pending:
+                return
+            if pending[0][0] > cursor + 1:
+                await send(json.dumps({"type": "gap", "from": cursor + 1, "to": pending[0][0] - 1}, separators=(",", ":")))
+            for sequence, message in pending:
+                await send(message)
+                cursor = sequence
+    
+    async def _pump(self, since: Optional[int], send) -> None:
+        """Önce arabelleği tekrar oynat, yetişince canlı kuyruğa abone ol ve mesajları yaz
+        
+        Abone tekrar oynatma bitene kadar kaydedilmez; böylece kuyruk sınırı yalnızca canlı mesajlara uygulanır.
+        """
+        if since is not None:
+            await self._replay(since, send)
+        # _replay ile kayıt arasında await yok: arada yayınlanan mesaj kaçmaz
+        client_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.stream_client_queue)
+        client_id = id(client_queue)
+        self.clients[client_id] = client_queue
+        try:
+            while True:
+                message = await client_queue.get()
+                if message is None:
+                    return
+                await send(message)
+        finally:
+            self.clients.pop(client_id, None)
+    
+    def _track(self) -> None:
+        """Bağlantı görevini kapatırken iptal edilmek üzere kaydet"""
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _handle_unix(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Unix soketi abonesi: satır başına bir JSON mesajı"""
+        self._track()
+        since = None
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=0.5)
+            since = json.loads(line).get("since") if line.strip() else None
+        except (asyncio.TimeoutError, ValueError, AttributeError):
+            pass
+        
+        async def send(message: str) -> None:
+            writer.write(message.encode("utf-8") + b"\n")
+            await writer.drain()
+        
+        try:
+            await self._pump(since, send)
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            # İptal stop() kaynaklıdır: görev normal bitsin ki sunucu geri çağrısı hata loglamasın
+            pass
+        finally:
+            writer.close()
+    
+    async def _handle_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """WebSocket abonesi (RFC 6455 el sıkışması, metin çerçeveleri)"""
+        self._track()
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.CancelledError):
+            writer.close()
+            return
+        
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        key = headers.get("sec-websocket-key")
+        if not key:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            writer.close()
+            return
+        # Tarayıcılar Origin gönderir: izin listesinde olmayan sayfalar altyazıları okuyamaz (yerel araçlar göndermez)
+        origin = headers.get("origin")
+        if origin is not None and origin not in self.config.stream_allowed_origins:
+            logger.warning(f"Canlı yayın: izin verilmeyen köken reddedildi: {origin}")
+            writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+            writer.close()
+            return
+        
+        accept = base64.b64encode(hashlib.sha1((key + self.WS_GUID).encode()).digest()).decode()
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+        ).encode())
+        
+        path = lines[0].split(" ")[1] if len(lines[0].split(" ")) > 1 else "/"
+        since_values = parse_qs(urlparse(path).query).get("since")
+        since = int(since_values[0]) if since_values and since_values[0].isdigit() else None
+        
+        async def send(message: str) -> None:
+            writer.write(self._ws_frame(message.encode("utf-8")))
+            await writer.drain()
+        
+        pump = asyncio.ensure_future(self._pump(since, send))
+        pump.add_done_callback(lambda _: writer.close())
+        try:
+            # İstemci çerçevelerini oku: kapatma ve ping'e yanıt ver
+            while not pump.done():
+                header = await reader.readexactly(2)
+                opcode = header[0] & 0x0F
+                length = header[1] & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", await reader.readexactly(8))[0]
+                if length > self.WS_MAX_CLIENT_PAYLOAD:
+                    # İstemci yalnızca kontrol çerçevesi gönderir: büyük çerçeveyi okumadan kapat (1009)
+                    writer.write(self._ws_frame(struct.pack("!H", 1009), opcode=0x8))
+                    break
+                mask = await reader.readexactly(4) if header[1] & 0x80 else b"\x00" * 4
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(await reader.readexactly(length)))
+                if opcode == 0x8:
+                    break
+                if opcode == 0x9:
+                    writer.write(self._ws_frame(payload, opcode=0xA))
+        except (asyncio.IncompleteReadError, ConnectionError, OSError, asyncio.CancelledError):
+            pass
+        finally:
+            pump.cancel()
+            writer.close()
+    
+    @staticmethod
+    def _ws_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+        """Maskesiz (sunucu) WebSocket çerçevesi"""
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        return header + payload
+
+
+class TranslationCache:
+    """Tüm hedef diller ve oturumlar arasında paylaşılan LRU çeviri önbelleği"""
+    
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, source: str, target: str, text: str) -> Optional[str]:
+        """Önbellekteki çeviriyi döndür"""
+        key = (source, target, text)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, source: str, target: str, text: str, translated: str) -> None:
+        """Çeviriyi önbelleğe ekle"""
+        with self._lock:
+            self._entries[(source, target, text)] = translated
+            self._entries.move_to_end((source, target, text))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class SamplingProfiler:
+    """
+    Düşük maliyetli örnekleyici profilleyici
+    
+    Ayrı bir iş parçacığı belirli aralıklarla tüm iş parçacıklarının yığınlarını okur (GUI, motor,
+    hotkey, çıktı hedefleri). Sonuç flamegraph.pl / speedscope ile açılabilen "collapsed stack"
+    dosyası ve en yoğun fonksiyonların özeti olarak log dizinine yazılır.
+    """
+    
+    def __init__(self, interval: float = 0.005, top_n: int = 25, label: str = "gui"):
+        self.interval = interval
+        self.top_n = top_n
+        self.label = label
+        self._stacks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._cpu_time = 0.0
+        self.samples = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Örneklemeyi başlat"""
+        if self.running:
+            return
+        self._stacks = {}
+        self.samples = 0
+        self._stop.clear()
+        self._started = time.time()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"[PROFİL] {self.label} örnekleme başladı ({self.interval * 1000:.0f} ms aralık)")
+    
+    def stop(self) -> Optional[Tuple[Path, Path]]:
+        """Örneklemeyi durdur ve çıktıları yaz"""
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        return self.write()
+    
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            cpu_start = time.thread_time()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                key = ";".join(reversed(stack))
+                self._stacks[key] = self._stacks.get(key, 0) + 1
+            self.samples += 1
+            self._cpu_time += time.thread_time() - cpu_start
+    
+    def summary(self) -> str:
+        """En çok örneklenen fonksiyonlar (kendi / kapsayıcı)"""
+        own_counts: Dict[str, int] = {}
+        total_counts: Dict[str, int] = {}
+        for key, count in self._stacks.items():
+            frames = key.split(";")
+            own_counts[frames[-1]] = own_counts.get(frames[-1], 0) + count
+            for name in set(frames[1:]):
+                total_counts[name] = total_counts.get(name, 0) + count
+        
+        total = max(sum(self._stacks.values()), 1)
+        elapsed = time.time() - self._started
+        lines = [
+            f"NEXUS PRIME profil ({self.label}) - {datetime.now().isoformat(timespec='seconds')}",
+            f"{self.samples} örnek, {elapsed:.1f} sn, örnekleyici CPU {self._cpu_time * 1000:.0f} ms "
+            f"(%{self._cpu_time / max(elapsed, 1e-9) * 100:.2f})",
+            "",
+            f"En yoğun {self.top_n} fonksiyon (kendi süresi):"
+        ]
+        for name, count in sorted(own_counts.items(), key=lambda item: -item[1])[:self.top_n]:
+            lines.append(f"  {count / total * 100:6.2f}%  {count:7d}  {name}")
+        lines += ["", f"En yoğun {self.top_n} fonksiyon (kapsayıcı):"]
+        for name, count in sorted(total_counts.items(), key=lambda item: -item[1])[:self.top_n]:
+            lines.append(f"  {count / total * 100:6.2f}%  {count:7d}  {name}")
+        return "\n".join(lines) + "\n"
+    
+    def write(self) -> Tuple[Path, Path]:
+        """Collapsed stack ve özet dosyalarını log dizinine yaz"""
+        base = AppConfig.get_log_path().parent / f"profile_{self.label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        collapsed_path = base.with_suffix(".collapsed")
+        summary_path = base.with_suffix(".txt")
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for key, count in sorted(self._stacks.items()):
+                f.write(f"{key} {count}\n")
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(self.summary())
+        logger.info(f"[PROFİL] {self.label}: {self.samples} örnek → {collapsed_path.name}, {summary_path.name}")
+        return collapsed_path, summary_path
+
+
+class LatencyTracker:
+    """Adlandırılmış gecikme örneklerini tutar ve özetler (ort / p50 / p95)"""
+    
+    def __init__(self, max_samples: int = 1000):
+        self._samples: Dict[str, deque] = {}
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+    
+    def add(self, name: str, seconds: float) -> None:
+        """Bir örnek ekle"""
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self._max_samples)).append(seconds)
+    
+    def summary(self, name: str) -> Dict[str, float]:
+        """Örnek sayısı, ortalama ve yüzdelikler (ms)"""
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+        return {
+            "count": len(samples),
+            "avg_ms": sum(samples) / len(samples) * 1000,
+            "p50_ms": samples[len(samples) // 2] * 1000,
+            "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000
+        }
+    
+    def report(self) -> str:
+        """Tüm adların tek satırlık özeti"""
+        with self._lock:
+            names = list(self._samples)
+        parts = []
+        for name in names:
+            summary = self.summary(name)
+            parts.append(f"{name}: n={summary['count']} ort {summary['avg_ms']:.0f} ms, "
+                         f"p50 {summary['p50_ms']:.0f} ms, p95 {summary['p95_ms']:.0f} ms")
+        return "; ".join(parts)
+
+
+PRIORITY_LIVE = 0  # Overlay'e giden canlı satırlar
+PRIORITY_SPECULATIVE = 1  # Henüz gönderilmemiş, kararlı metnin ön çevirisi
+PRIORITY_BACKGROUND = 2  # Yeniden çeviri, geçmiş doldurma vb.
+PRIORITY_NAMES = {PRIORITY_LIVE: "canlı", PRIORITY_SPECULATIVE: "spekülatif", PRIORITY_BACKGROUND: "arka plan"}
+
+
+class TokenBucket:
+    """Sabit hızla dolan jeton kovası (rate <= 0 ise sınırsız)"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float, now: float) -> float:
+        """Bu miktar için beklenmesi gereken süre (saniye)"""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+    
+    def consume(self, amount: float, now: float) -> None:
+        """Jetonları harca"""
+        if self.rate > 0:
+            self._refill(now)
+            self.tokens -= min(amount, self.capacity)
+
+
+class TranslationScheduler:
+    """
+    Çeviri isteklerini sağlayıcıya hız bütçeleri ve öncelik sınıflarıyla ileten zamanlayıcı
+    
+    Saniyedeki istek ve dakikadaki karakter sayısı jeton kovalarıyla sınırlanır. Canlı satırlar her zaman
+    spekülatif ve arka plan işlerinin önüne geçer; aynı metin için uçuştaki istekler tek çağrıda birleştirilir.
+    Başarısız çağrılar geri çekilmeyle kendi sınıflarının sonuna eklenir, yeni canlı satırları bekletmez.
+    """
+    
+    def __init__(self, translator_factory=GoogleTranslator, requests_per_second: float = 5.0,
+                 chars_per_minute: float = 0.0, workers: int = 4, max_retries: int = 2, retry_backoff: float = 0.5):
+        self.translator_factory = translator_factory
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._translators: Dict[Tuple[str, str], object] = {}
+        self._queues: Dict[int, deque] = {priority: deque() for priority in sorted(PRIORITY_NAMES)}
+        self._inflight: Dict[Tuple[str, str, str], Dict] = {}
+        self._running = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._request_bucket = TokenBucket(requests_per_second, requests_per_second)
+        self._char_bucket = TokenBucket(chars_per_minute / 60, chars_per_minute)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="translate")
+        self._served: Dict[str, int] = {}  # Oturum başına gönderilen istek (adil paylaşım için)
+        self.queue_wait = LatencyTracker()
+        self.stats = {"submitted": 0, "merged": 0, "sent": 0, "retries": 0, "failed": 0, "cancelled": 0}
+        self._thread = threading.Thread(target=self._dispatch, name="translate-scheduler", daemon=True)
+        self._thread.start()
+    
+    @classmethod
+    def from_config(cls, config: AppConfig, translator_factory=GoogleTranslator) -> "TranslationScheduler":
+        """Yapılandırmadaki bütçelerle zamanlayıcı oluştur"""
+        return cls(
+            translator_factory,
+            requests_per_second=config.translate_requests_per_second,
+            chars_per_minute=config.translate_chars_per_minute,
+            workers=config.translate_workers,
+            max_retries=config.translate_max_retries,
+            retry_backoff=config.translate_retry_backoff
+        )
+    
+    def submit(self, text: str, source: str, target: str, priority: int = PRIORITY_LIVE, session: str = "") -> Future:
+        """İsteği kuyruğa ekle (aynı metin uçuştaysa ona katıl)"""
+        future: Future = Future()
+        key = (source, target, text)
+        with self._cond:
+            self.stats["submitted"] += 1
+            item = self._inflight.get(key)
+            if item:
+                self.stats["merged"] += 1
+                if item["state"] == "running":
+                    future.set_running_or_notify_cancel()
+                item["waiters"].append(future)
+                self._promote(item, priority)
+                return future
+            
+            item = {
+                "key": key, "priority": priority, "session": session, "waiters": [future], "state": "queued",
+                "enqueued_at": time.monotonic(), "ready_at": 0.0, "attempts": 0
+            }
+            self._inflight[key] = item
+            self._queues[priority].append(item)
+            self._cond.notify()
+        return future
+    
+    def promote(self, text: str, source: str, target: str, priority: int = PRIORITY_LIVE) -> None:
+        """Kuyruktaki isteği daha yüksek öncelik sınıfına taşı"""
+        with self._cond:
+            item = self._inflight.get((source, target, text))
+            if item:
+                self._promote(item, priority)
+    
+    def _promote(self, item: Dict, priority: int) -> None:
+        if priority < item["priority"] and item["state"] == "queued":
+            self._queues[item["priority"]].remove(item)
+            item["priority"] = priority
+            self._queues[priority].append(item)
+            self._cond.notify()
+    
+    def translate(self, text: str, source: str, target: str, priority: int = PRIORITY_LIVE) -> Optional[str]:
+        """Bloklayan kısayol"""
+        return self.submit(text, source, target, priority).result()
+    
+    def _next_ready(self, now: float) -> Tuple[Optional[Dict], Optional[float]]:
+        """Öncelik sırasıyla gönderilebilecek isteği bul; yoksa bekleme süresini döndür
+        
+        Aynı sınıf içinde en az hizmet almış oturumun isteği seçilir (oturumlar arası adil paylaşım).
+        """
+        wait = None
+        for priority, pending in self._queues.items():
+            candidate = None
+            for item in list(pending):
+                if all(future.cancelled() for future in item["waiters"]):
+                    pending.remove(item)
+                    del self._inflight[item["key"]]
+                    self.stats["cancelled"] += 1
+                    continue
+                if item["ready_at"] > now:
+                    wait = min(wait or math.inf, item["ready_at"] - now)
+                    continue
+                if candidate is None or self._served.get(item["session"], 0) < self._served.get(candidate["session"], 0):
+                    candidate = item
+            if candidate is None:
+                continue
+            # Kesin öncelik: bütçe bekleyen üst sınıfın jetonlarını alt sınıflar harcayamaz
+            throttle = max(self._request_bucket.wait_time(1, now),
+                           self._char_bucket.wait_time(len(candidate["key"][2]), now))
+            if throttle > 0:
+                return None, min(wait or math.inf, throttle)
+            pending.remove(candidate)
+            return candidate, None
+        return None, wait
+    
+    def _dispatch(self) -> None:
+        """Bütçe ve işçi sınırına göre istekleri sağlayıcıya ilet"""
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    item = wait = None
+                    if self._running < self.workers:
+                        item, wait = self._next_ready(time.monotonic())
+                    if item:
+                        break
+                    self._cond.wait(timeout=wait)
+                
+                now = time.monotonic()
+                self._request_bucket.consume(1, now)
+                self._char_bucket.consume(len(item["key"][2]), now)
+                item["waiters"] = [future for future in item["waiters"]
+                                   if future.running() or future.set_running_or_notify_cancel()]
+                item["state"] = "running"
+                self._running += 1
+                self._served[item["session"]] = self._served.get(item["session"], 0) + 1
+                self.stats["sent"] += 1
+                if item["attempts"] == 0:
+                    self.queue_wait.add(PRIORITY_NAMES[item["priority"]], now - item["enqueued_at"])
+            self._pool.submit(self._run, item)
+    
+    def _get_translator(self, source: str, target: str):
+        key = (source, target)
+        with self._cond:
+            if key not in self._translators:
+                self._translators[key] = self.translator_factory(source=source, target=target)
+            return self._translators[key]
+    
+    def _run(self, item: Dict) -> None:
+        """İsteği gönder; hata olursa geri çekilmeyle yeniden kuyruğa al"""
+        source, target, text = item["key"]
+        result = error = None
+        try:
+            result = self._get_translator(source, target).translate(text)
+        except Exception as e:
+            error = e
+        
+        with self._cond:
+            self._running -= 1
+            if error is not None and item["attempts"] < self.max_retries and not self._closed:
+                item["attempts"] += 1
+                item["state"] = "queued"
+                item["ready_at"] = time.monotonic() + self.retry_backoff * 2 ** (item["attempts"] - 1)
+                self._queues[item["priority"]].append(item)
+                self.stats["retries"] += 1
+                logger.warning(f"Çeviri isteği başarısız ({source}->{target}), yeniden denenecek: {error}")
+                self._cond.notify()
+                return
+            del self._inflight[item["key"]]
+            if error is not None:
+                self.stats["failed"] += 1
+            waiters = item["waiters"]
+            self._cond.notify()
+        
+        for future in waiters:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+    
+    def report(self) -> str:
+        """İstek sayıları ve sınıf başına kuyruk bekleme özeti"""
+        with self._cond:
+            stats = dict(self.stats)
+        waits = ", ".join(f"{name} p95 {self.queue_wait.summary(name)['p95_ms']:.0f} ms"
+                          for name in PRIORITY_NAMES.values() if self.queue_wait.summary(name)["count"])
+        return (f"{stats['submitted']} istek, {stats['merged']} birleştirildi, {stats['sent']} gönderildi, "
+                f"{stats['retries']} yeniden deneme, {stats['failed']} başarısız, {stats['cancelled']} iptal"
+                + (f"; bekleme: {waits}" if waits else ""))
+    
+    def shutdown(self) -> None:
+        """Dağıtıcıyı durdur; bekleyen istekler iptal edilir"""
+        with self._cond:
+            self._closed = True
+            pending = [item for queue_ in self._queues.values() for item in queue_]
+            for queue_ in self._queues.values():
+                queue_.clear()
+            for item in pending:
+                self._inflight.pop(item["key"], None)
+            self._cond.notify_all()
+        for item in pending:
+            for future in item["waiters"]:
+                if not future.cancel() and not future.done():
+                    future.set_exception(RuntimeError("Çeviri zamanlayıcısı kapatıldı"))
+        self._pool.shutdown(wait=False)
+
+
+class StubTranslator:
+    """Ağ kullanmayan yerel çevirmen (dayanıklılık testi ve zamanlayıcı denemeleri için)"""
+    
+    def __init__(self, source: str = "auto", target: str = "tr", delay: float = 0.05):
+        self.source = source
+        self.target = target
+        self.delay = delay
+        self.calls = 0
+    
+    def translate(self, text: str) -> str:
+        """Gecikme ekleyip metni hedef dil etiketiyle döndür"""
+        self.calls += 1
+        time.sleep(self.delay)
+        return f"[{self.target}] {text}"
+
+
+class TranslationEngine:
+    """Ön işleme → OCR → cümle tespiti → çeviri hattı (arayüzden bağımsız)"""
+    
+    def __init__(self, config: AppConfig, settings: Dict, tesseract_mgr: Optional[TesseractManager] = None,
+                 translation_cache: Optional[TranslationCache] = None, translator_factory=GoogleTranslator,
+                 scheduler: Optional[TranslationScheduler] = None, session: str = "", clock=time.time):
+        self.config = config
+        self.clock = clock  # Kayıt tekrar oynatılırken sanal saat
+        self.settings = dict(settings)
+        self.session = session
+        self._owns_scheduler = scheduler is None
+        self.scheduler = scheduler or TranslationScheduler.from_config(config, translator_factory)
+        self._owns_tesseract = tesseract_mgr is None
+        self.tesseract_mgr = tesseract_mgr or TesseractManager(config)
+        self.image_processor = ImageProcessor()
+        self.language_detector = LanguageDetector()
+        self.translation_cache = translation_cache or TranslationCache(config.translation_cache_size)
+        self._speculation: Optional[Dict] = None
+        self._speculation_waste: deque = deque()
+        self.accumulated_text = ""
+        self.last_update_time = self.clock()
+        self.appeared_at = 0.0
+        self.stable_frames = 0
+        self.clear_frames = 0
+        self.committed_text = ""
+        self.last_commit: Dict = {}
+        self.metrics = {
+            "frames": 0, "commits": 0, "ocr_time": 0.0, "translate_time": 0.0,
+            "spec_started": 0, "spec_used": 0, "spec_cancelled": 0, "spec_wasted_calls": 0,
+            "spec_skipped": 0, "spec_hidden_time": 0.0
+        }
+        self.stage_latency = LatencyTracker()  # Aşama gecikmeleri ("ocr", "çeviri"); okuyan değiştirip sıfırlar
+    
+    @staticmethod
+    def default_settings(config: AppConfig) -> Dict:
+        """Arayüz olmadan çalışırken (test, tekrar oynatma) kullanılacak ayarlar"""
+        return {
+            "source_language": config.source_language,
+            "target_language": config.target_language,
+            "contrast": config.contrast_level,
+            "color_key": config.ocr_color_key,
+            "auto_detect_source": config.auto_detect_source,
+            "extra_target_languages": list(config.extra_target_languages),
+            "ocr_interval": config.ocr_interval
+        }
+    
+    def configure(self, settings: Dict) -> None:
+        """Yeni ayarları uygula (çevirmenler ve bölge düzeni sıfırlanır)"""
+        self._discard_speculation()
+        self.settings = dict(settings)
+        self.image_processor.reset_layout()
+    
+    def shutdown(self) -> None:
+        """İş havuzlarını kapat"""
+        self._discard_speculation()
+        if self._owns_scheduler:
+            self.scheduler.shutdown()
+        if self._owns_tesseract:
+            self.tesseract_mgr.shutdown()
+    
+    @staticmethod
+    def capture(region: Tuple[int, int, int, int]) -> Image.Image:
+        """Bölgenin ekran görüntüsünü al"""
+        return pyautogui.screenshot(region=region)
+    
+    def _ocr(self, processed: Image.Image) -> str:
+        """Ön işlenmiş kareye kontrast ve ölçek uygulayıp metni çıkart"""
+        # Kontrast ayarını uygula
+        enhancer = ImageEnhance.Contrast(processed)
+        processed = enhancer.enhance(self.settings["contrast"])
+        
+        # Yazı yüksekliğine göre ölçekle
+        processed = self.image_processor.scale_for_ocr(processed, self.config)
+        
+        # Metin çıkart (çok satırlı bölgelerde satırlar paralel OCR'lanır)
+        if self.config.ocr_parallel_lines:
+            return self.tesseract_mgr.extract_lines_parallel(self.image_processor.split_lines(processed), session=self.session)
+        return self.tesseract_mgr.submit(processed, session=self.session).result()
+    
+    def _color_key_agrees(self, keyed_text: str, classic_text: str) -> bool:
+        """Maskeli OCR metni klasik zincirin metniyle yeterince örtüşüyor mu?"""
+        keyed = " ".join(keyed_text.lower().split())
+        classic = " ".join(classic_text.lower().split())
+        if not classic:
+            return True
+        return difflib.SequenceMatcher(None, keyed, classic).ratio() >= self.config.color_key_verify_similarity
+    
+    def recognize(self, screenshot: Image.Image) -> str:
+        """Kareyi ön işle ve metni çıkart
+        
+        Renk anahtarı yalnızca klasik zincirin yazı bulduğu karelerden öğrenilir ve maskeli OCR
+        aynı metni verdiğinde kullanılır; color_key_verify_every karede bir yeniden doğrulanır.
+        """
+        processor = self.image_processor
+        use_key = self.settings["color_key"]
+        text = self._ocr(processor.prepare(screenshot, self.config, use_key))
+        if not use_key:
+            return text
+        
+        if processor.needs_verification(self.config):
+            classic = self._ocr(processor.prepare_for_ocr(screenshot, self.config))
+            if not self._color_key_agrees(text, classic):
+                processor.reject_key(self.config, f"maskeli metin {text[:30]!r}, klasik metin {classic[:30]!r}")
+                return classic
+        elif processor.color_key is None and text.strip() and processor.learn_key(screenshot, self.config):
+            keyed = self._ocr(processor.color_key_mask(screenshot, processor.color_key, self.config))
+            if not self._color_key_agrees(keyed, text):
+                processor.reject_key(self.config, f"maskeli metin {keyed[:30]!r}, klasik metin {text[:30]!r}")
+        return text
+    
+    def observe(self, current_text: str) -> Optional[str]:
+        """OCR metnini izle; cümle tamamlandıysa döndür
+        
+        Sinyaller: bitiş noktalaması + ardışık karelerde kararlılık, bölgenin temizlenmesi,
+        altyazının farklı bir metinle değişmesi; hiçbiri gelmezse duraklama süresi.
+        """
+        now = self.clock()
+        
+        # Bölge temizlendi mi? (altyazı ekrandan kalktı)
+        if len(current_text) <= 1:
+            self.committed_text = ""
+            if not self.accumulated_text:
+                return None
+            self.clear_frames += 1
+            if self.clear_frames >= self.config.commit_clear_frames:
+                return self._commit("temizlendi", now)
+            return None
+        self.clear_frames = 0
+        
+        # Gönderilmiş altyazı hâlâ ekranda: tekrar çevirme
+        if current_text == self.committed_text:
+            return None
+        
+        if current_text != self.accumulated_text:
+            previous = self.accumulated_text
+            if previous and not self._continues(previous, current_text):
+                # Yeni altyazı eskisinin yerini aldı: öncekini hemen gönder
+                sentence = self._commit("değişti", now)
+                self._begin(current_text, now)
+                return sentence
+            if not previous:
+                self.appeared_at = now
+            self.accumulated_text = current_text
+            self.last_update_time = now
+            self.stable_frames = 1
+        else:
+            self.stable_frames += 1
+        
+        # Cümle bitiş noktalamasıyla bitiyor ve birkaç karedir değişmedi mi?
+        if (self.accumulated_text.rstrip().endswith(self.config.commit_terminal_punctuation)
+                and self.stable_frames >= self.config.commit_stable_frames):
+            return self._commit("noktalama", now)
+        
+        # Yedek: metin duraklama süresi boyunca değişmedi mi?
+        if now - self.last_update_time > self.config.sentence_pause_threshold:
+            return self._commit("süre", now)
+        return None
+    
+    def _begin(self, text: str, now: float) -> None:
+        """Yeni bir altyazıyı izlemeye başla"""
+        self.accumulated_text = text
+        self.appeared_at = now
+        self.last_update_time = now
+        self.stable_frames = 1
+    
+    def _commit(self, reason: str, now: float) -> str:
+        """Biriken metni gönder ve zamanlama bilgisini sakla"""
+        sentence = self.accumulated_text
+        # Eski kural (yalnız süre) bu cümleyi ne zaman gönderirdi? Değişen altyazıyı hiç göndermezdi.
+        if reason == "değişti":
+            legacy_commit_at = None
+        elif reason == "süre":
+            legacy_commit_at = now
+        else:
+            legacy_commit_at = self.last_update_time + self.config.sentence_pause_threshold
+        self.last_commit = {
+            "commit_reason": reason,
+            "appeared_at": self.appeared_at,
+            "committed_at": now,
+            "legacy_commit_at": legacy_commit_at
+        }
+        self.committed_text = sentence
+        self.accumulated_text = ""
+        self.stable_frames = 0
+        self.clear_frames = 0
+        return sentence
+    
+    @staticmethod
+    def _continues(previous: str, current: str) -> bool:
+        """Yeni metin öncekinin devamı mı (kelime kelime beliren altyazı / OCR gürültüsü)?"""
+        prefix = current[:len(previous)]
+        return difflib.SequenceMatcher(None, previous, prefix).ratio() >= 0.6
+    
+    def step(self, screenshot: Image.Image) -> Optional[Dict]:
+        """Bir kareyi işle; cümle tamamlandıysa çeviri sonucunu döndür"""
+        start = time.perf_counter()
+        current_text = self.recognize(screenshot)
+        elapsed = time.perf_counter() - start
+        self.metrics["frames"] += 1
+        self.metrics["ocr_time"] += elapsed
+        self.stage_latency.add("ocr", elapsed)
+        
+        sentence = self.observe(current_text)
+        if sentence is None:
+            self._speculate()
+            return None
+        return self.commit(sentence)
+    
+    def commit(self, text: str) -> Dict:
+        """Tamamlanan cümleyi tüm hedef dillere çevir (varsa spekülatif sonucu kullanarak)"""
+        start = time.perf_counter()
+        speculation = self._speculation if self._speculation and self._speculation["text"] == text else None
+        if speculation:
+            self._speculation = None
+            committed_at = self.clock()
+            source_language = speculation["source"]
+            decision = speculation["decision"]
+            futures = speculation["futures"]
+            # Hâlâ kuyruktaysa canlı sınıfa taşı
+            for target in futures:
+                self.scheduler.promote(text, source_language, target, PRIORITY_LIVE)
+            translations = self._collect(text, source_language, futures)
+            done_at = max((getattr(future, "done_at", committed_at) for future in futures.values()),
+                          default=committed_at)
+            self.metrics["spec_used"] += 1
+            self.metrics["spec_hidden_time"] += max(0.0, min(committed_at, done_at) - speculation["started_at"])
+        else:
+            self._discard_speculation()
+            source_language, decision = self.resolve_source_language(text)
+            futures = self._submit_all(text, source_language, PRIORITY_LIVE)
+            translations = self._collect(text, source_language, futures)
+        if decision:
+            logger.info(decision)
+        elapsed = time.perf_counter() - start
+        self.metrics["commits"] += 1
+        self.metrics["translate_time"] += elapsed
+        self.stage_latency.add("çeviri", elapsed)
+        # Hedef dildeki metin önbellekten değil doğrudan geçer: önbellek isabeti sayılmaz
+        cached = {target: getattr(future, "from_cache", False) and target != source_language
+                  for target, future in futures.items()}
+        return {"original": text, "source_language": source_language, "target_language": self.settings["target_language"],
+                "translations": translations, "cached": cached, **self.last_commit}
+    
+    def _speculate(self) -> None:
+        """Kısa süre kararlı kalan metnin çevirisini gönderimden önce başlat"""
+        if self._speculation and self._speculation["text"] != self.accumulated_text:
+            # Metin değişti: uçuştaki çeviri artık geçersiz
+            self._discard_speculation()
+        
+        text = self.accumulated_text
+        if not self.config.speculative_enabled or not text or self._speculation:
+            return
+        now = self.clock()
+        if now - self.last_update_time < self.config.speculative_window:
+            return
+        
+        # Boşa giden çağrı bütçesi (son 60 saniye)
+        while self._speculation_waste and now - self._speculation_waste[0] > 60:
+            self._speculation_waste.popleft()
+        if len(self._speculation_waste) >= self.config.speculative_waste_budget:
+            self.metrics["spec_skipped"] += 1
+            return
+        
+        source_language, decision = self.resolve_source_language(text)
+        if decision:
+            logger.debug(f"{decision} (spekülatif)")
+        futures = self._submit_all(text, source_language, PRIORITY_SPECULATIVE)
+        for future in futures.values():
+            future.add_done_callback(lambda f: setattr(f, "done_at", self.clock()))
+        self._speculation = {"text": text, "source": source_language, "decision": decision,
+                             "started_at": now, "futures": futures}
+        self.metrics["spec_started"] += 1
+    
+    def _discard_speculation(self) -> None:
+        """Spekülatif çeviriyi iptal et; kuyruktan çıkmış istekleri boşa giden çağrı olarak say"""
+        speculation, self._speculation = self._speculation, None
+        if not speculation:
+            return
+        now = self.clock()
+        for future in speculation["futures"].values():
+            if future.cancel():
+                self.metrics["spec_cancelled"] += 1
+            elif not getattr(future, "from_cache", False):
+                self.metrics["spec_wasted_calls"] += 1
+                self._speculation_waste.append(now)
+    
+    @staticmethod
+    def speculation_report(metrics: Dict) -> str:
+        """Spekülatif çevirinin gizlediği gecikme ve ek istek özeti"""
+        used = metrics.get("spec_used", 0)
+        hidden_ms = metrics.get("spec_hidden_time", 0.0) / used * 1000 if used else 0.0
+        return (f"{metrics.get('spec_started', 0)} başlatıldı, {used} kullanıldı "
+                f"(cümle başına {hidden_ms:.0f} ms gizlendi), {metrics.get('spec_cancelled', 0)} iptal, "
+                f"{metrics.get('spec_wasted_calls', 0)} boşa çağrı, {metrics.get('spec_skipped', 0)} bütçe nedeniyle atlandı")
+    
+    def resolve_source_language(self, text: str) -> Tuple[str, Optional[str]]:
+        """Cümlenin kaynak dilini yerel dil tanıma ile belirle (ağ çağrısı yok)
+        
+        (kaynak dil, [DİL] log satırı) döndürür; kararı gönderimde bir kez loglamak çağırana kalır.
+        """
+        source_language = self.settings["source_language"]
+        if not self.config.language_id_enabled:
+            return source_language, None
+        
+        language, confidence = self.language_detector.detect(text)
+        confident = language is not None and confidence >= self.config.language_id_min_confidence
+        if confident and language in self.target_languages():
+            decision = "atla (hedef dilde)"
+            resolved = language
+        elif confident and self.settings["auto_detect_source"] and language != source_language:
+            decision = f"kaynak={language}"
+            resolved = language
+        else:
+            decision = f"çevir ({source_language})"
+            resolved = source_language
+        
+        return resolved, f"[DİL] tespit={language} güven={confidence:.2f} karar={decision} metin={text[:40]!r}"
+    
+    def target_languages(self) -> List[str]:
+        """Birincil hedef dil ve ek hedef diller"""
+        return [self.settings["target_language"], *self.settings["extra_target_languages"]]
+    
+    def translate(self, text: str, source_language: str, target_language: str,
+                  priority: int = PRIORITY_LIVE) -> Optional[str]:
+        """Tek hedef dile çevir (paylaşılan önbellek ve zamanlayıcı üzerinden)"""
+        futures = self._submit_all(text, source_language, priority, [target_language])
+        return self._collect(text, source_language, futures)[target_language]
+    
+    def translate_all(self, text: str, source_language: str, priority: int = PRIORITY_LIVE) -> Dict[str, Optional[str]]:
+        """Metni tüm hedef dillere eşzamanlı çevir (toplam gecikme ~tek çağrı)"""
+        return self._collect(text, source_language, self._submit_all(text, source_language, priority))
+    
+    def _submit_all(self, text: str, source_language: str, priority: int,
+                    targets: Optional[List[str]] = None) -> Dict[str, Future]:
+        """Önbellekte olmayan hedefleri zamanlayıcıya gönder"""
+        futures = {}
+        for target in targets or self.target_languages():
+            cached = text if source_language == target else self.translation_cache.get(source_language, target, text)
+            if cached is not None:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                future.set_result(cached)
+                future.from_cache = True
+            else:
+                future = self.scheduler.submit(text, source_language, target, priority, self.session)
+            futures[target] = future
+        return futures
+    
+    def _collect(self, text: str, source_language: str, futures: Dict[str, Future]) -> Dict[str, Optional[str]]:
+        """Sonuçları bekle ve önbelleğe yaz"""
+        results = {}
+        for target, future in futures.items():
+            try:
+                results[target] = future.result()
+            except Exception as e:
+                logger.error(f"Çeviri hatası ({target}): {e}")
+                results[target] = None
+                continue
+            if results[target] and not getattr(future, "from_cache", False):
+                self.translation_cache.put(source_language, target, text, results[target])
+        return results
+    
+    def report_metrics(self) -> Dict:
+        """Motor metrikleri ve zamanlayıcı özeti"""
+        return {**self.metrics, "scheduler": self.scheduler.report()}
+
+
+class FrameRecorder:
+    """
+    Yakalanan kareleri zaman damgalarıyla kompakt bir kayıt dosyasına yazar (.nxrec)
+    
+    Biçim: MAGIC başlığı ve ardışık kayıtlar. İlk kez görülen kare PNG olarak ("F": zaman, boyut, PNG),
+    daha önce görülmüş kare yalnızca numarasıyla ("D": zaman, kare no) yazılır; sabit altyazı ve boş
+    bölge kareleri böylece birkaç bayta iner. Dosya max_bytes sınırına ulaşınca kayıt durur.
+    """
+    
+    MAGIC = b"NXREC1\n"
+    FRAME = struct.Struct("<cdI")
+    
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._file = open(self.path, 'wb')
+        self._file.write(self.MAGIC)
+        self._hashes: Dict[bytes, int] = {}
+        self._started = time.time()
+        self.bytes_written = len(self.MAGIC)
+        self.stats = {"frames": 0, "unique": 0, "raw_bytes": 0}
+        self.full = False
+    
+    @classmethod
+    def for_session(cls, config: AppConfig, name: str) -> "FrameRecorder":
+        """Kayıt dizininde oturum adı ve zamanla adlandırılmış kayıt aç"""
+        record_dir = AppConfig.get_project_root() / config.record_dir
+        path = record_dir / f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.nxrec"
+        return cls(path, int(config.record_max_mb * 2 ** 20))
+    
+    def add(self, image: Image.Image, timestamp: Optional[float] = None) -> bool:
+        """Kareyi kaydet; boyut sınırı aşıldıysa False"""
+        if self.full:
+            return False
+        elapsed = (timestamp or time.time()) - self._started
+        raw = image.tobytes()
+        digest = hashlib.blake2b(raw + f"{image.mode}{image.size}".encode(), digest_size=16).digest()
+        
+        frame_id = self._hashes.get(digest)
+        if frame_id is not None:
+            record = self.FRAME.pack(b"D", elapsed, frame_id)
+        else:
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG", compress_level=6)
+            data = buffer.getvalue()
+            record = self.FRAME.pack(b"F", elapsed, len(data)) + data
+        
+        if self.bytes_written + len(record) > self.max_bytes:
+            self.full = True
+            logger.warning(f"[KAYIT] Boyut sınırına ulaşıldı, kayıt durdu: {self.path}")
+            return False
+        
+        if frame_id is None:
+            self._hashes[digest] = self.stats["unique"]
+            self.stats["unique"] += 1
+        self._file.write(record)
+        self.bytes_written += len(record)
+        self.stats["frames"] += 1
+        self.stats["raw_bytes"] += len(raw)
+        return True
+    
+    def close(self) -> str:
+        """Dosyayı kapat ve özet döndür"""
+        if not self._file.closed:
+            self._file.close()
+        ratio = self.stats["raw_bytes"] / max(self.bytes_written, 1)
+        return (f"{self.path.name}: {self.stats['frames']} kare ({self.stats['unique']} benzersiz), "
+                f"{self.bytes_written / 2 ** 20:.2f} MB, sıkıştırma {ratio:.0f}x")
+
+
+class FrameReplay:
+    """.nxrec kaydını ekran ve ağ olmadan tekrar oynatır (özgün hızda veya olabildiğince hızlı)"""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+    
+    def __iter__(self):
+        """(zaman, kare) çiftlerini kayıt sırasıyla üret"""
+        offsets: List[Tuple[int, int]] = []  # Kare no → (konum, boyut); kareler bellekte tutulmaz
+        with open(self.path, 'rb') as f:
+            if f.read(len(FrameRecorder.MAGIC)) != FrameRecorder.MAGIC:
+                raise ValueError(f"Geçersiz kayıt dosyası: {self.path}")
+            while True:
+                header = f.read(FrameRecorder.FRAME.size)
+                if len(header) < FrameRecorder.FRAME.size:
+                    return
+                kind, timestamp, value = FrameRecorder.FRAME.unpack(header)
+                if kind == b"F":
+                    offsets.append((f.tell(), value))
+                    data = f.read(value)
+                else:
+                    position = f.tell()
+                    offset, size = offsets[value]
+                    f.seek(offset)
+                    data = f.read(size)
+                    f.seek(position)
+                with Image.open(io.BytesIO(data)) as image:
+                    yield timestamp, image.copy()
+    
+    def frames(self, realtime: bool = False):
+        """Kareleri üret; realtime ise kayıttaki aralıklarla bekle"""
+        started = time.perf_counter()
+        for timestamp, image in self:
+            if realtime:
+                delay = timestamp - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            yield timestamp, image
+
+
+class CaptureSession:
+    """Kendi bölgesi, dilleri ve cümle durumu (motoru) olan bağımsız yakalama oturumu"""
+    
+    def __init__(self, name: str, region: Tuple[int, int, int, int], engine: TranslationEngine, on_result,
+                 recorder: Optional[FrameRecorder] = None, source=None):
+        self.name = name
+        self.region = region
+        self.engine = engine
+        self.on_result = on_result
+        self.recorder = recorder
+        self.source = source or engine.capture  # source(bölge) -> kare; dayanıklılık testi sahte kaynak verir
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Yakalama döngüsünü başlat"""
+        self.running = True
+        self._thread = threading.Thread(target=self._loop, name=f"session-{self.name}", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 0) -> bool:
+        """Döngüyü durdur; timeout verilirse mevcut karenin bitmesini bekle
+        
+        İş parçacığı çıktıysa True döner (motor başka bir oturumda güvenle yeniden kullanılabilir).
+        """
+        self.running = False
+        if self._thread is None or self._thread is threading.current_thread():
+            return True
+        self._thread.join(timeout=max(timeout, 0))
+        return not self._thread.is_alive()
+    
+    def _loop(self) -> None:
+        """Ana işleme döngüsü"""
+        error_count = 0
+        
+        try:
+            logger.info(f"[{self.name}] İşleme döngüsü başladı")
+            
+            while self.running:
+                try:
+                    # Ekran görüntüsünü yakala ve işle
+                    screenshot = self.source(self.region)
+                    if self.recorder:
+                        self.recorder.add(screenshot)
+                    # Ön işleme/OCR/çeviri hataları dıştaki sayaca ve beklemeye gider
+                    result = self.engine.step(screenshot)
+                    error_count = 0  # Kare başarıyla işlendi: sayacı sıfırla
+                    
+                    if result and self.running:
+                        try:
+                            self.on_result(result)
+                        except Exception as e:
+                            logger.error(f"[{self.name}] Sonuç dağıtma hatası: {e}", exc_info=True)
+                    
+                    time.sleep(self.engine.settings["ocr_interval"])
+                    
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"[{self.name}] İşleme hatası ({error_count}): {e}", exc_info=True)
+                    
+                    if error_count > 10:
+                        logger.error(f"[{self.name}] Çok fazla hata, işleme durduruldu")
+                        self.running = False
+                        break
+                    
+                    time.sleep(1)
+        
+        except Exception as e:
+            logger.error(f"[{self.name}] Process loop kritik hatası: {e}", exc_info=True)
+        finally:
+            if self.recorder:
+                logger.info(f"[KAYIT] {self.recorder.close()}")
+            logger.info(f"[{self.name}] İşleme döngüsü sona erdi")
+
+
+class SessionManager:
+    """
+    Birden çok yakalama oturumunu tek OCR havuzu, tek çeviri zamanlayıcısı ve ortak önbellekle çalıştırır
+    
+    OCR işleri oturumlar arasında sırayla, çeviri istekleri en az hizmet alan oturuma öncelik vererek
+    dağıtılır; aynı altyazıyı gören oturumlar önbellek ve uçuştaki istek birleştirmesini paylaşır.
+    """
+    
+    def __init__(self, config: AppConfig, translator_factory=GoogleTranslator):
+        self.config = config
+        self.tesseract_mgr = TesseractManager(config)
+        self.translation_cache = TranslationCache(config.translation_cache_size)
+        self.scheduler = TranslationScheduler.from_config(config, translator_factory)
+        self.sessions: Dict[str, CaptureSession] = {}
+    
+    def create_engine(self, settings: Dict, name: str) -> TranslationEngine:
+        """Ortak kaynakları kullanan motor oluştur"""
+        return TranslationEngine(
+            self.config, settings,
+            tesseract_mgr=self.tesseract_mgr,
+            translation_cache=self.translation_cache,
+            scheduler=self.scheduler,
+            session=name
+        )
+    
+    def start(self, name: str, region: Tuple[int, int, int, int], engine: TranslationEngine, on_result,
+              recorder: Optional[FrameRecorder] = None, source=None) -> CaptureSession:
+        """Oturumu başlat"""
+        self.stop(name)
+        session = CaptureSession(name, region, engine, on_result, recorder, source)
+        self.sessions[name] = session
+        session.start()
+        return session
+    
+    def stop(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Oturumu durdur, iş parçacığının çıkmasını bekle ve listeden çıkar
         
-        try:
-            return pytesseract.image_to_string(image, lang=language).strip()
-        except Exception as e:
-            logger.error(f"OCR hatası: {e}")
-            return ""
+        Süre dolduğunda iş parçacığı hâlâ motorun içindeyse False döner.
+        """
+        session = self.sessions.pop(name, None)
+        if session is None:
+            return True
+        stopped = session.stop(self.config.session_stop_timeout if timeout is None else timeout)
+        if not stopped:
+            logger.warning(f"[{name}] Oturum iş parçacığı bekleme süresi içinde çıkmadı")
+        return stopped
+    
+    def stop_all(self) -> bool:
+        """Tüm oturumları durdur (bekleme süresi oturumlar arasında paylaşılır)"""
+        for session in self.sessions.values():
+            session.running = False
+        deadline = time.time() + self.config.session_stop_timeout
+        stopped = True
+        for name in list(self.sessions):
+            stopped = self.stop(name, deadline - time.time()) and stopped
+        return stopped
+    
+    def report(self) -> str:
+        """Oturum başına kare/cümle sayıları ve ortak zamanlayıcı özeti"""
+        parts = [f"{name}: {session.engine.metrics['frames']} kare, {session.engine.metrics['commits']} cümle"
+                 for name, session in self.sessions.items()]
+        return "; ".join(parts + [f"zamanlayıcı: {self.scheduler.report()}"])
+    
+    def shutdown(self) -> None:
+        """Oturumları ve ortak havuzları kapat"""
+        self.stop_all()
+        self.scheduler.shutdown()
+        self.tesseract_mgr.shutdown()
 
 
-class ImageProcessor:
-    """Görüntü işleme işlemleri"""
+def _engine_process_main(commands: "multiprocessing.Queue", results: "multiprocessing.Queue",
+                         region: Tuple[int, int, int, int], settings: Dict) -> None:
+    """Motor süreci giriş noktası: yakala → işle → sonuçları GUI'ye gönder"""
+    config = AppConfig()
+    config.load_ocr_profile()
+    engine = TranslationEngine(config, settings)
+    profiler = SamplingProfiler(config.profiler_interval, config.profiler_top_n, label="engine")
+    recorder = FrameRecorder.for_session(config, "ana") if settings.get("record_frames") else None
+    error_count = 0
+    last_metrics = time.time()
     
-    @staticmethod
-    def prepare_for_ocr(image: Image.Image, config: AppConfig) -> Image.Image:
-        """OCR için görüntüyü optimize et"""
-        try:
-            # Gri tonlamaya dönüştür ve ters çevir
-            image = ImageOps.invert(ImageOps.grayscale(image))
+    try:
+        while True:
+            # GUI komutlarını bloklamadan oku
+            try:
+                while True:
+                    command = commands.get_nowait()
+                    if command["type"] == "stop":
+                        return
+                    if command["type"] == "profile":
+                        if command["enabled"]:
+                            profiler.start()
+                        else:
+                            profiler.stop()
+                    if command["type"] == "configure":
+                        if command.get("settings"):
+                            engine.configure(command["settings"])
+                        if command.get("region"):
+                            region = command["region"]
+                            engine.image_processor.reset_layout()
+            except queue.Empty:
+                pass
             
-            # Kontrastı artır
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(config.contrast_level)
+            try:
+                screenshot = engine.capture(region)
+                if recorder:
+                    recorder.add(screenshot)
+                result = engine.step(screenshot)
+                if result:
+                    results.put({"type": "result", **result})
+                error_count = 0
+            except Exception as e:
+                error_count += 1
+                logger.error(f"Motor süreci işleme hatası ({error_count}): {e}", exc_info=True)
+                if error_count > 10:
+                    results.put({"type": "fatal", "error": str(e)})
+                    return
+                time.sleep(1)
             
-            # Parlaklığı ayarla
-            brightness_enhancer = ImageEnhance.Brightness(image)
-            image = brightness_enhancer.enhance(config.brightness_level)
+            if time.time() - last_metrics >= 1.0:
+                results.put({"type": "metrics", **engine.report_metrics()})
+                last_metrics = time.time()
             
-            return image
-        except Exception as e:
-            logger.error(f"Görüntü işleme hatası: {e}")
-            return image
+            time.sleep(engine.settings["ocr_interval"])
+    finally:
+        profiler.stop()
+        if recorder:
+            logger.info(f"[KAYIT] {recorder.close()}")
+        engine.shutdown()
 
 
-class SubtitleOverlay(tk.Toplevel):
-    """Çeviri sonuçlarını gösteren overlay penceresi (animasyonlu)"""
+class EngineProcess:
+    """Yakalama/OCR hattını ayrı bir süreçte çalıştıran denetleyici (çökme yalıtımı ve yeniden başlatma)"""
     
-    def __init__(self, config: AppConfig, theme: str = "neon"):
-        super().__init__()
+    def __init__(self, config: AppConfig):
         self.config = config
-        self.theme = theme
-        self.colors = AnimationManager.get_theme_colors(theme)
-        self.pulse_step = 0
-        self._setup_window()
-        self._setup_ui()
-        self._bind_events()
-        self._start_pulse_animation()
-    
-    def _setup_window(self) -> None:
-        """Pencere özelliklerini yapılandır"""
-        self.overrideredirect(True)
-        self.attributes("-topmost", True, "-alpha", self.config.overlay_alpha)
-        self.configure(bg=self.colors["bg"])
-        self.geometry(self.config.overlay_geometry)
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._commands = None
+        self._results = None
+        self._region: Optional[Tuple[int, int, int, int]] = None
+        self._settings: Dict = {}
+        self.restarts = 0
+        self.metrics: Dict = {}
     
-    def _setup_ui(self) -> None:
-        """UI öğelerini oluştur (animasyonlu sınır)"""
-        # Animasyonlu neon sınır
-        self.border = tk.Frame(self, bg=self.colors["primary"], padx=2, pady=2)
-        self.border.pack(expand=True, fill="both")
-        
-        # İç çerçeve
-        self.inner = tk.Frame(self.border, bg=self.colors["bg"])
-        self.inner.pack(expand=True, fill="both")
-        
-        # Durum etiketi
-        self.status = tk.Label(
-            self.inner,
-            text="◉ HAZIR",
-            font=("Roboto", 10, "bold"),
-            fg=self.colors["accent"],
-            bg=self.colors["bg"]
-        )
-        self.status.pack(anchor="ne", padx=10, pady=5)
-        
-        # Metin etiketi (ana)
-        self.label = tk.Label(
-            self.inner,
-            text="NEXUS AI: Konuşma Bekleniyor...",
-            font=(self.config.font_name, self.config.font_size, "bold"),
-            fg=self.colors["fg"],
-            bg=self.colors["bg"],
-            wraplength=self.config.wrap_length,
-            justify="center"
-        )
-        self.label.pack(expand=True, fill="both", padx=15, pady=15)
-        
-        # Alt bilgi
-        self.info = tk.Label(
-            self.inner,
-            text="Sürükle: Pencereyi taşı",
-            font=("Roboto", 8),
-            fg=self.colors["secondary"],
-            bg=self.colors["bg"]
+    def start(self, region: Tuple[int, int, int, int], settings: Dict) -> None:
+        """Motor sürecini başlat"""
+        self._region = region
+        self._settings = dict(settings)
+        self._commands = self._context.Queue()
+        self._results = self._context.Queue()
+        self._process = self._context.Process(
+            target=_engine_process_main,
+            args=(self._commands, self._results, region, self._settings),
+            name="nexus-engine",
+            daemon=True
         )
-        self.info.pack(anchor="s", padx=5, pady=5)
-    
-    def _bind_events(self) -> None:
-        """Olay bağlantılarını ayarla (sürükleme)"""
-        self.bind("<Button-1>", self._start_drag)
-        self.bind("<B1-Motion>", self._drag)
-    
-    def _start_drag(self, event) -> None:
-        """Sürükleme başlat"""
-        self.drag_x = event.x
-        self.drag_y = event.y
+        self._process.start()
+        logger.info(f"Motor süreci başlatıldı (pid={self._process.pid})")
     
-    def _drag(self, event) -> None:
-        """Pencereyi sürükle"""
-        new_x = self.winfo_x() + (event.x - self.drag_x)
-        new_y = self.winfo_y() + (event.y - self.drag_y)
-        self.geometry(f"+{new_x}+{new_y}")
+    def configure(self, settings: Optional[Dict] = None, region: Optional[Tuple[int, int, int, int]] = None) -> None:
+        """Çalışan motora yeni ayar/bölge gönder"""
+        if settings is not None:
+            self._settings = dict(settings)
+        if region is not None:
+            self._region = region
+        if self._commands is not None:
+            self._commands.put({"type": "configure", "settings": settings, "region": region})
     
-    def _start_pulse_animation(self) -> None:
-        """Pulse animasyonunu başlat"""
-        self._animate_pulse()
+    def profile(self, enabled: bool) -> None:
+        """Motor sürecinde profilleyiciyi başlat/durdur"""
+        if self._commands is not None:
+            self._commands.put({"type": "profile", "enabled": enabled})
     
-    def _animate_pulse(self) -> None:
-        """Sınırı animasyonlu renk döngüsüne sok"""
+    def stop(self) -> None:
+        """Motor sürecini durdur"""
+        if self._process is None:
+            return
         try:
-            if not self.winfo_exists():
-                return
-            
-            colors_seq = [
-                self.colors["primary"],
-                self.colors["secondary"],
-                self.colors["accent"],
-                self.colors["primary"]
-            ]
-            color = colors_seq[self.pulse_step % len(colors_seq)]
-            self.border.configure(bg=color)
-            
-            self.pulse_step += 1
-            self.after(300, self._animate_pulse)
+            self._commands.put({"type": "stop"})
+            self._process.join(timeout=3)
+            if self._process.is_alive():
+                self._process.terminate()
         except Exception as e:
-            logger.warning(f"Animation hatası: {e}")
+            logger.warning(f"Motor süreci durdurma hatası: {e}")
+        self._process = None
     
-    def update_text(self, text: str) -> None:
-        """Gösterilen metni güncelle"""
-        try:
-            self.label.config(text=text, fg=self.colors["fg"])
-            self.status.config(text="✓ ÇEVRILI", fg=self.colors["accent"])
-            self.update()
-        except Exception as e:
-            logger.warning(f"Text update hatası: {e}")
+    def poll(self) -> List[Dict]:
+        """Bekleyen mesajları al; süreç çöktüyse yeniden başlat"""
+        messages = []
+        if self._results is not None:
+            try:
+                while True:
+                    message = self._results.get_nowait()
+                    if message["type"] == "metrics":
+                        self.metrics = message
+                    else:
+                        messages.append(message)
+            except queue.Empty:
+                pass
+        
+        if self._process is not None and not self._process.is_alive():
+            exit_code = self._process.exitcode
+            self._process = None
+            if self.restarts < self.config.engine_max_restarts and not any(m["type"] == "fatal" for m in messages):
+                self.restarts += 1
+                logger.error(f"Motor süreci beklenmedik şekilde sonlandı (kod={exit_code}), yeniden başlatılıyor ({self.restarts})")
+                messages.append({"type": "restarted", "exit_code": exit_code})
+                self.start(self._region, self._settings)
+            else:
+                messages.append({"type": "fatal", "error": f"Motor süreci sonlandı (kod={exit_code})"})
+        return messages
 
 
-class TranslationHistory:
-    """Çeviri geçmişi yönetimi"""
+class SoakTest:
+    """
+    Uzun süreli dayanıklılık testi
     
-    def __init__(self, history_file: str = "translation_history.json"):
-        self.history_file = history_file
-        self.history: List[Dict] = []
-        self.stats = {"total_translations": 0, "total_characters": 0}
-        self.load()
+    Gerçek uygulamayı (gizli pencere; oturum, overlay, çıktı hedefleri, çoklu geçmiş ve log kutusu dahil)
+    sahte kare kaynağı ve yerel çevirmenle açar, çeviriyi toggle_translation ile başlatıp durdurur;
+    RSS, tracemalloc, iş parçacığı sayısı ve aşama gecikmelerini örnekler, büyüme bütçeleri aşılırsa
+    başarısız olur. Tk gerektirir (ekransız makinede xvfb-run ile çalıştırın).
+    """
     
-    def add(self, original: str, translated: str, language_pair: str) -> None:
-        """Çeviriye geçmişe ekle"""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "original": original,
-            "translated": translated,
-            "language_pair": language_pair
-        }
-        self.history.append(entry)
-        self.stats["total_translations"] += 1
-        self.stats["total_characters"] += len(original)
-        self.save()
+    def __init__(self, config: AppConfig, duration: float, cycles: int = 4, frames_dir: Optional[str] = None):
+        self.config = config
+        self.duration = duration
+        self.cycles = max(1, cycles)
+        self.frames_dir = frames_dir
+        self.samples: List[Dict] = []
+        self.cycle_threads: List[int] = []
+        self.engine: Optional[TranslationEngine] = None
     
-    def save(self) -> None:
-        """Geçmişi kaydet"""
+    @staticmethod
+    def rss_mb() -> float:
+        """Sürecin anlık yerleşik belleği (MB, ölçülemezse 0)"""
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump({"history": self.history, "stats": self.stats}, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Geçmiş kaydetme hatası: {e}")
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+        except (OSError, ValueError, AttributeError):
+            pass
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+        except ImportError:
+            return 0.0
     
-    def load(self) -> None:
-        """Geçmişi yükle"""
+    def _frames(self):
+        """Kayıtlı kareleri veya sentetik altyazı karelerini sonsuz döngüde üret"""
+        if self.frames_dir and Path(self.frames_dir).is_file():
+            while True:
+                count = 0
+                for _, image in FrameReplay(self.frames_dir):
+                    count += 1
+                    yield image
+                if not count:
+                    raise ValueError(f"Kayıtta kare yok: {self.frames_dir}")
+        if self.frames_dir:
+            paths = sorted(p for p in Path(self.frames_dir).iterdir() if p.suffix.lower() in (".png", ".jpg", ".jpeg", ".bmp"))
+            if not paths:
+                raise ValueError(f"Kare bulunamadı: {self.frames_dir}")
+            while True:
+                for path in paths:
+                    with Image.open(path) as image:
+                        yield image.convert("RGB")
+        
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.history = data.get("history", [])
-                    self.stats = data.get("stats", {"total_translations": 0, "total_characters": 0})
-        except Exception as e:
-            logger.error(f"Geçmiş yükleme hatası: {e}")
+            font = ImageFont.truetype("DejaVuSans.ttf", 28)
+        except OSError:
+            font = ImageFont.load_default()
+        lines = [line.strip().capitalize() + "." for line in LanguageDetector.SEED_TEXTS["en"].split(".") if line.strip()]
+        blank = Image.new("RGB", (900, 80), "black")
+        while True:
+            for line in lines:
+                frame = blank.copy()
+                ImageDraw.Draw(frame).text((20, 20), line, fill="white", font=font)
+                for _ in range(self.config.soak_frames_per_line):
+                    yield frame
+                for _ in range(2):
+                    yield blank
     
-    def get_recent(self, limit: int = 10) -> List[Dict]:
-        """Son çevirileri getir"""
-        return self.history[-limit:]
+    def _sample(self, started: float, cycle: int) -> Dict:
+        """Kaynak kullanımını ve son penceredeki aşama gecikmelerini örnekle"""
+        current, _ = tracemalloc.get_traced_memory()
+        window, self.engine.stage_latency = self.engine.stage_latency, LatencyTracker()
+        sample = {
+            "elapsed": round(time.time() - started, 1),
+            "cycle": cycle,
+            "rss_mb": round(self.rss_mb(), 1),
+            "heap_mb": round(current / 2 ** 20, 2),
+            "threads": threading.active_count(),
+            "ocr_p95_ms": round(window.summary("ocr")["p95_ms"], 1),
+            "commit_p95_ms": round(window.summary("çeviri")["p95_ms"], 1)
+        }
+        self.samples.append(sample)
+        print(f"[{sample['elapsed']:7.1f} sn] döngü {cycle}  RSS {sample['rss_mb']:7.1f} MB  heap {sample['heap_mb']:6.2f} MB  "
+              f"iş parçacığı {sample['threads']:3d}  OCR p95 {sample['ocr_p95_ms']:6.1f} ms  çeviri p95 {sample['commit_p95_ms']:6.1f} ms")
+        return sample
+    
+    def _run_cycle(self, cycle: int, app: "NexusSentenceMode", until: float, started: float) -> None:
+        """Bir başlat/durdur döngüsü: kullanıcının çeviriyi açıp kapatması gibi uygulamanın kendi yolunu çalıştırır"""
+        app.toggle_translation()
+        if not app.running:
+            raise RuntimeError("Çeviri başlatılamadı (log dosyasına bakın)")
+        last_sample = time.time()
+        try:
+            while time.time() < until:
+                app.update()
+                if time.time() - last_sample >= self.config.soak_sample_interval:
+                    self._sample(started, cycle)
+                    last_sample = time.time()
+                time.sleep(0.01)
+        finally:
+            if app.running:
+                app.toggle_translation()
+            app.update()
+    
+    def _check_budgets(self, baseline: Dict, final: Dict) -> List[str]:
+        """Bütçeleri aşan büyümeleri döndür"""
+        failures = []
+        rss_growth = final["rss_mb"] - baseline["rss_mb"]
+        if rss_growth > self.config.soak_rss_budget_mb:
+            failures.append(f"RSS {rss_growth:.1f} MB büyüdü (bütçe {self.config.soak_rss_budget_mb} MB)")
+        heap_growth = final["heap_mb"] - baseline["heap_mb"]
+        if heap_growth > self.config.soak_heap_budget_mb:
+            failures.append(f"Python heap {heap_growth:.2f} MB büyüdü (bütçe {self.config.soak_heap_budget_mb} MB)")
+        if len(self.cycle_threads) > 1:
+            thread_growth = self.cycle_threads[-1] - self.cycle_threads[0]
+            if thread_growth > self.config.soak_thread_budget:
+                failures.append(f"Durdurulduktan sonra {thread_growth} iş parçacığı fazla kaldı (bütçe {self.config.soak_thread_budget})")
+        for key in ("ocr_p95_ms", "commit_p95_ms"):
+            if baseline[key] > 0 and final[key] > baseline[key] * self.config.soak_latency_drift:
+                failures.append(f"{key} {baseline[key]:.1f} → {final[key]:.1f} ms (izin verilen kat {self.config.soak_latency_drift})")
+        return failures
+    
+    def run(self) -> int:
+        """Testi çalıştır; bütçeler aşılırsa 1 döndür"""
+        if not TesseractManager(self.config).available:
+            logger.error("Dayanıklılık testi için Tesseract gerekli")
+            return 1
+        
+        frames = self._frames()
+        frames_lock = threading.Lock()
+        try:
+            pending = [next(frames)]  # Kare kaynağı hatalarını oturum iş parçacığından önce yakala
+        except (ValueError, OSError) as e:
+            logger.error(f"Dayanıklılık testi kareleri okunamadı: {e}")
+            return 1
+        
+        def capture(region: Tuple[int, int, int, int]) -> Image.Image:
+            with frames_lock:
+                return pending.pop() if pending else next(frames)
+        
+        tracemalloc.start(25)
+        started = time.time()
+        cycle_length = self.duration / self.cycles
+        
+        with tempfile.TemporaryDirectory(prefix="nexus_soak_") as work_dir:
+            self.config.engine_mode = "thread"  # Sahte kare kaynağı motor sürecine aktarılamaz
+            self.config.output_file_path = os.path.join(work_dir, "live.txt")
+            try:
+                app = NexusSentenceMode(
+                    self.config,
+                    translator_factory=lambda source, target: StubTranslator(source, target, self.config.soak_translate_delay),
+                    history_dir=os.path.join(work_dir, "history"),
+                    capture_source=capture
+                )
+            except tk.TclError as e:
+                tracemalloc.stop()
+                logger.error(f"Dayanıklılık testi ekran gerektirir (ekransız makinede: xvfb-run python main.py --soak ...): {e}")
+                return 1
+            
+            app.withdraw()
+            app.selected_region = (0, 0, 900, 80)
+            app.settings.update({
+                "ocr_interval": self.config.soak_frame_interval,
+                "write_file": True,
+                "extra_target_languages": ["de"],
+                "engine_process": False,
+                "record_frames": False
+            })
+            app.engine.configure(app.settings)
+            self.engine = app.engine
+            
+            try:
+                for cycle in range(1, self.cycles + 1):
+                    self._run_cycle(cycle, app, started + cycle * cycle_length, started)
+                    time.sleep(0.5)  # Kapanan iş parçacıklarının çıkmasını bekle
+                    app.update()
+                    self.cycle_threads.append(threading.active_count())
+                    self.engine = app.engine  # Durmayan oturum yüzünden motor yenilenmiş olabilir
+                    sample = self._sample(started, cycle)
+                    if cycle == 1:
+                        # İlk döngü ısınmadır (önbellekler, modeller); büyüme buradan ölçülür
+                        baseline = self.samples[0] if self.cycles == 1 else sample
+                        baseline_snapshot = tracemalloc.take_snapshot()
+                final_snapshot = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+                app.close_app()
+        
+        final = self.samples[-1]
+        
+        print("\nEn çok büyüyen ayırmalar:")
+        top = final_snapshot.compare_to(baseline_snapshot, "lineno")[:10]
+        for stat in top:
+            print(f"  {stat}")
+        
+        failures = self._check_budgets(baseline, final)
+        report_path = AppConfig.get_log_path().parent / f"soak_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "duration": self.duration,
+                "cycles": self.cycles,
+                "samples": self.samples,
+                "threads_after_cycle": self.cycle_threads,
+                "top_allocations": [str(stat) for stat in top],
+                "failures": failures
+            }, f, ensure_ascii=False, indent=2)
+        
+        for failure in failures:
+            print(f"❌ {failure}")
+        print(f"{'❌ BAŞARISIZ' if failures else '✓ BAŞARILI'} - rapor: {report_path}")
+        return 1 if failures else 0
 
 
 class NexusSentenceMode(ctk.CTk):
     """Ana uygulama penceresi"""
     
-    def __init__(self):
+    def __init__(self, config: Optional[AppConfig] = None, translator_factory=GoogleTranslator,
+                 history_dir: str = "translation_history", capture_source=None):
         super().__init__()
-        self.config = AppConfig()
-        self.history = TranslationHistory()
-        self.animation_step = 0
+        self.config = config or AppConfig()
+        if self.config.load_ocr_profile():
+            logger.info("Kaydedilmiş OCR profili yüklendi")
+        # Dayanıklılık testi yerel çevirmen, geçici geçmiş dizini ve sahte kare kaynağı verir
+        self.translator_factory = translator_factory
+        self.history_dir = history_dir
+        self.capture_source = capture_source
+        self.history = TranslationHistory(history_dir, self.config.history_segment_max_entries)
+        self.animation_scheduler = AnimationScheduler(self, self.config.animation_idle_timeout)
         self.current_theme = "neon"
         self._setup_variables()
         self._setup_window()
@@ -335,23 +3255,16 @@ class NexusSentenceMode(ctk.CTk):
         logger.info("NEXUS PRIME v18.0 başlatıldı")
     
     def _start_ui_animation(self) -> None:
-        """UI animasyonunu başlat"""
-        self._animate_ui()
+        """UI animasyonunu merkezi zamanlayıcıya kaydet"""
+        # Kullanıcı etkileşimi boşta kalan zamanlayıcıyı uyandırır
+        for sequence in ("<Motion>", "<Key>", "<FocusIn>"):
+            self.bind(sequence, lambda e: self.animation_scheduler.poke(), add="+")
+        self.animation_scheduler.register("title", self._animate_ui, 500, owner=self)
     
-    def _animate_ui(self) -> None:
-        """Başlık animasyonunu güncelle"""
-        try:
-            if not self.winfo_exists():
-                return
-            
-            colors = ["#00d2ff", "#ff006e", "#ffbe0b", "#00ff88"]
-            color = colors[self.animation_step % len(colors)]
-            self.title_label.configure(text_color=color)
-            
-            self.animation_step += 1
-            self.after(500, self._animate_ui)
-        except Exception as e:
-            logger.warning(f"UI animation hatası: {e}")
+    def _animate_ui(self, step: int) -> List[Tuple[tk.Misc, Dict]]:
+        """Başlığın renk döngüsündeki bir sonraki rengi"""
+        colors = ["#00d2ff", "#ff006e", "#ffbe0b", "#00ff88"]
+        return [(self.title_label, {"text_color": colors[step % len(colors)]})]
     
     def _setup_variables(self) -> None:
         """Uygulama değişkenlerini başlat"""
@@ -374,29 +3287,56 @@ class NexusSentenceMode(ctk.CTk):
             "ocr_interval": self.config.ocr_interval,
             "contrast": self.config.contrast_level,
             "enable_sound": True,
-            "auto_copy": False
+            "auto_copy": False,
+            "copy_clipboard": False,
+            "write_file": False,
+            "color_key": self.config.ocr_color_key,
+            "auto_detect_source": self.config.auto_detect_source,
+            "extra_target_languages": list(self.config.extra_target_languages),
+            "engine_process": self.config.engine_mode == "process",
+            "record_frames": self.config.record_frames
         }
         
         # Bileşenleri başlat
-        self.tesseract_mgr = TesseractManager(self.config)
-        self.image_processor = ImageProcessor()
-        
-        try:
-            self.translator = GoogleTranslator(
-                source=self.settings["source_language"],
-                target=self.settings["target_language"]
-            )
-        except Exception as e:
-            logger.error(f"Çevirmen başlatma hatası: {e}")
-            self.translator = None
+        self.session_manager = SessionManager(self.config, self.translator_factory)
+        self.engine = self.session_manager.create_engine(self.settings, "ana")
+        self.main_session: Optional[CaptureSession] = None
+        self.session_overlays: Dict[str, SubtitleOverlay] = {}
+        self.tesseract_mgr = self.engine.tesseract_mgr
+        self.image_processor = self.engine.image_processor
+        self.engine_process: Optional[EngineProcess] = None
+        self.latency = LatencyTracker()
+        self.profiler = SamplingProfiler(self.config.profiler_interval, self.config.profiler_top_n)
         
         self.overlay: Optional[SubtitleOverlay] = None
+        self.output_sinks = OutputSinkManager()
+        self.stream_server: Optional[LiveStreamServer] = None
+        if self.config.stream_enabled:
+            self.stream_server = LiveStreamServer(self.config)
+            self.stream_server.start()
+        # Ek hedef diller: her biri kendi overlay'i ve geçmiş dosyasıyla
+        self.extra_overlays: Dict[str, SubtitleOverlay] = {}
+        self.extra_histories: Dict[str, TranslationHistory] = {}
     
     def _setup_window(self) -> None:
         """Ana pencereyi yapılandır"""
         self.title(f"NEXUS PRIME v{self.config.version}")
         self.geometry(self.config.window_geometry)
         ctk.set_appearance_mode("dark")
+        self.protocol("WM_DELETE_WINDOW", self.close_app)
+    
+    def close_app(self) -> None:
+        """Çeviriyi durdur, geçmiş ve analitik toplamlarını diske yaz, arka plan kaynaklarını kapatıp çık"""
+        if self.running:
+            self.toggle_translation()
+        self._save_histories()
+        if self.profiler.running:
+            self.profiler.stop()
+        if self.stream_server:
+            self.stream_server.stop()
+            self.stream_server = None
+        self.session_manager.shutdown()
+        self.destroy()
     
     def _setup_ui(self) -> None:
         """Kullanıcı arayüzünü oluştur (geliştirilmiş animasyonlu)"""
@@ -508,6 +3448,18 @@ class NexusSentenceMode(ctk.CTk):
             chars = self.history.stats.get("total_characters", 0)
             self.stats_translations.configure(text=f"Çeviri: {total}")
             self.stats_characters.configure(text=f"Karakter: {chars}")
+            
+            summary = self.history.analytics.summary()
+            self.stats_total.configure(text=str(summary["count"]))
+            self.stats_chars.configure(text=str(summary["characters"]))
+            self.stats_avg.configure(text=f"{summary['avg_characters']:.0f} kr")
+            latency = f"{summary['avg_latency_ms']:.0f} ms" if summary["avg_latency_ms"] is not None else "-"
+            busiest = f"{summary['busiest_hour']:02d}:00" if summary["busiest_hour"] is not None else "-"
+            self.stats_details.configure(text=(
+                f"⏱ Bu dakika {summary['this_minute']} • bu saat {summary['this_hour']} • bugün {summary['today']}\n"
+                f"⚡ Ort. gecikme {latency} • önbellek isabeti %{summary['cache_hit_rate'] * 100:.0f} • "
+                f"en yoğun saat {busiest} • en çok {summary['top_pair'] or '-'}"
+            ))
         except Exception as e:
             logger.warning(f"Stats update hatası: {e}")
     
@@ -593,6 +3545,16 @@ class NexusSentenceMode(ctk.CTk):
         self.target_lang.set("tr")
         self.target_lang.pack(fill="x", padx=25, pady=(0, 10))
         
+        ctk.CTkLabel(lang_frame, text="Ek Hedef Diller (virgülle, örn: en,de):", font=("Roboto", 11)).pack(anchor="w", padx=25)
+        self.extra_targets_entry = ctk.CTkEntry(lang_frame, font=("Roboto", 10))
+        self.extra_targets_entry.insert(0, ",".join(self.config.extra_target_languages))
+        self.extra_targets_entry.pack(fill="x", padx=25, pady=(0, 10))
+        
+        self.auto_detect_check = ctk.CTkCheckBox(lang_frame, text="🔎 Kaynak dili cümle bazında otomatik tespit et", font=("Roboto", 11))
+        if self.config.auto_detect_source:
+            self.auto_detect_check.select()
+        self.auto_detect_check.pack(anchor="w", padx=25, pady=(0, 10))
+        
         # OCR Ayarları (geliştirilmiş)
         ocr_frame = ctk.CTkFrame(scroll_frame, fg_color="#0d1b2a", corner_radius=8)
         ocr_frame.pack(fill="x", padx=10, pady=10)
@@ -617,11 +3579,50 @@ class NexusSentenceMode(ctk.CTk):
         features_frame.pack(fill="x", padx=10, pady=10)
         ctk.CTkLabel(features_frame, text="⚡ ÖZELLİKLER", font=("Roboto", 13, "bold"), text_color="#ffbe0b").pack(anchor="w", padx=15, pady=(10, 5))
         
-        self.auto_copy_check = ctk.CTkCheckBox(features_frame, text="📋 Otomatik Kopyala", font=("Roboto", 11))
+        self.auto_copy_check = ctk.CTkCheckBox(features_frame, text="⌨️ Otomatik Yaz (tuş vuruşu)", font=("Roboto", 11))
         self.auto_copy_check.pack(anchor="w", padx=25, pady=5)
         
+        self.clipboard_check = ctk.CTkCheckBox(features_frame, text="📋 Panoya Kopyala", font=("Roboto", 11))
+        self.clipboard_check.pack(anchor="w", padx=25, pady=5)
+        
+        self.file_sink_check = ctk.CTkCheckBox(features_frame, text=f"📝 Dosyaya Yaz ({self.config.output_file_path})", font=("Roboto", 11))
+        self.file_sink_check.pack(anchor="w", padx=25, pady=5)
+        
+        self.stream_check = ctk.CTkCheckBox(features_frame, text=f"📡 Canlı Yayın Sunucusu (ws://127.0.0.1:{self.config.stream_ws_port})", font=("Roboto", 11))
+        if self.config.stream_enabled:
+            self.stream_check.select()
+        self.stream_check.pack(anchor="w", padx=25, pady=5)
+        
+        self.engine_process_check = ctk.CTkCheckBox(features_frame, text="🧩 Motoru Ayrı Süreçte Çalıştır", font=("Roboto", 11))
+        if self.config.engine_mode == "process":
+            self.engine_process_check.select()
+        self.engine_process_check.pack(anchor="w", padx=25, pady=5)
+        
+        self.record_check = ctk.CTkCheckBox(features_frame, text="⏺ Kareleri Kaydet (sorun yeniden üretimi)", font=("Roboto", 11))
+        if self.config.record_frames:
+            self.record_check.select()
+        self.record_check.pack(anchor="w", padx=25, pady=5)
+        
         self.sound_check = ctk.CTkCheckBox(features_frame, text="🔊 Ses Bildirimi", font=("Roboto", 11))
-        self.sound_check.pack(anchor="w", padx=25, pady=(5, 10))
+        self.sound_check.pack(anchor="w", padx=25, pady=5)
+        
+        self.color_key_check = ctk.CTkCheckBox(features_frame, text="🎨 Altyazı Renk Anahtarı (arka planı temizle)", font=("Roboto", 11))
+        if self.config.ocr_color_key:
+            self.color_key_check.select()
+        self.color_key_check.pack(anchor="w", padx=25, pady=(5, 10))
+        
+        # Profilleyici
+        self.btn_profiler = ctk.CTkButton(
+            scroll_frame, text="🔬 PROFİLLEYİCİYİ BAŞLAT (Ctrl+Shift+P)",
+            height=40,
+            fg_color="#1a1a2e",
+            border_width=2,
+            border_color="#ffbe0b",
+            text_color="#ffbe0b",
+            font=("Roboto", 11, "bold"),
+            command=self.toggle_profiler
+        )
+        self.btn_profiler.pack(fill="x", padx=10, pady=(20, 0))
         
         # Kaydet butonu (geliştirilmiş)
         ctk.CTkButton(
@@ -673,6 +3674,10 @@ class NexusSentenceMode(ctk.CTk):
         self.stats_avg = ctk.CTkLabel(col3, text="0", font=("Roboto", 20, "bold"), text_color="#ffbe0b")
         self.stats_avg.pack(padx=10, pady=(0, 5))
         
+        # Artımlı analitik özeti
+        self.stats_details = ctk.CTkLabel(stats_frame, text="", font=("Roboto", 10), text_color="#e0aaff", justify="left")
+        self.stats_details.pack(anchor="w", padx=15, pady=(0, 10))
+        
         # Geçmiş listesi
         ctk.CTkLabel(history_tab, text="🕐 Son Çeviriler:", font=("Roboto", 12, "bold"), text_color="#00ff88").pack(anchor="w", padx=15, pady=(15, 5))
         
@@ -707,6 +3712,7 @@ class NexusSentenceMode(ctk.CTk):
             font=("Roboto", 12, "bold"),
             command=self._clear_history
         ).pack(fill="x", padx=10, pady=10)
+        self._update_stats_display()
     
     def _save_settings(self) -> None:
         """Ayarları kaydet ve istatistikleri güncelle"""
@@ -715,16 +3721,28 @@ class NexusSentenceMode(ctk.CTk):
         self.settings["contrast"] = self.contrast_slider.get()
         self.settings["ocr_interval"] = self.interval_slider.get()
         self.settings["auto_copy"] = self.auto_copy_check.get()
+        self.settings["copy_clipboard"] = bool(self.clipboard_check.get())
+        self.settings["write_file"] = bool(self.file_sink_check.get())
+        if self.stream_check.get() and not self.stream_server:
+            self.stream_server = LiveStreamServer(self.config)
+            self.stream_server.start()
+        elif not self.stream_check.get() and self.stream_server:
+            self.stream_server.stop()
+            self.stream_server = None
         self.settings["enable_sound"] = self.sound_check.get()
+        self.settings["color_key"] = bool(self.color_key_check.get())
+        self.settings["auto_detect_source"] = bool(self.auto_detect_check.get())
+        self.settings["extra_target_languages"] = [
+            lang.strip() for lang in self.extra_targets_entry.get().split(",")
+            if lang.strip() and lang.strip() != self.settings["target_language"]
+        ]
+        self.settings["engine_process"] = bool(self.engine_process_check.get())
+        self.settings["record_frames"] = bool(self.record_check.get())
         
-        # Çeviriciyi yeniden başlat
-        try:
-            self.translator = GoogleTranslator(
-                source=self.settings["source_language"],
-                target=self.settings["target_language"]
-            )
-        except:
-            pass
+        # Motoru yeni ayarlarla yeniden yapılandır
+        self.engine.configure(self.settings)
+        if self.engine_process:
+            self.engine_process.configure(settings=self.settings)
         
         self._log("[⚙️] Ayarlar kaydedildi")
         self._update_stats_display()
@@ -733,19 +3751,34 @@ class NexusSentenceMode(ctk.CTk):
     def _clear_history(self) -> None:
         """Geçmişi temizle"""
         if messagebox.askyesno("Onayla", "Geçmiş silinecek, emin misin?"):
-            self.history.history = []
-            self.history.stats = {"total_translations": 0, "total_characters": 0}
-            self.history.save()
+            self.history.clear()
             self._log("[🗑️] Geçmiş temizlendi")
             self._update_stats_display()
             self._switch_tab("Geçmiş")
     
+    def toggle_profiler(self) -> None:
+        """Örnekleyici profilleyiciyi başlat/durdur (motor süreci varsa onu da)"""
+        if self.profiler.running:
+            paths = self.profiler.stop()
+            if self.engine_process:
+                self.engine_process.profile(False)
+            self.btn_profiler.configure(text="🔬 PROFİLLEYİCİYİ BAŞLAT (Ctrl+Shift+P)")
+            if paths:
+                self._log(f"[🔬] Profil kaydedildi: {paths[0]}")
+        else:
+            self.profiler.start()
+            if self.engine_process:
+                self.engine_process.profile(True)
+            self.btn_profiler.configure(text="⏹ PROFİLLEYİCİYİ DURDUR (Ctrl+Shift+P)")
+            self._log("[🔬] Profilleyici başlatıldı")
+    
     def _setup_hotkeys(self) -> None:
         """Sistem hotkeys'ini ayarla"""
         try:
             keyboard.add_hotkey('ctrl+shift+s', self.toggle_translation)
             keyboard.add_hotkey('ctrl+shift+r', self.select_region)
-            logger.info("Hotkeys bağlandı: Ctrl+Shift+S (Başlat), Ctrl+Shift+R (Bölge seç)")
+            keyboard.add_hotkey('ctrl+shift+p', lambda: self.after(0, self.toggle_profiler))
+            logger.info("Hotkeys bağlandı: Ctrl+Shift+S (Başlat), Ctrl+Shift+R (Bölge seç), Ctrl+Shift+P (Profil)")
         except Exception as e:
             logger.warning(f"Hotkey kurulamadı: {e}")
     
@@ -773,6 +3806,9 @@ class NexusSentenceMode(ctk.CTk):
         try:
             self.terminal.configure(state="normal")
             self.terminal.insert("end", f"\n{message}")
+            lines = int(self.terminal.index("end-1c").split(".")[0])
+            if lines > self.config.terminal_max_lines:
+                self.terminal.delete("1.0", f"{lines - self.config.terminal_max_lines + 1}.0")
             self.terminal.see("end")
             self.terminal.configure(state="disabled")
         except Exception as e:
@@ -831,6 +3867,11 @@ class NexusSentenceMode(ctk.CTk):
                 abs(event.y - self.drag_start_y)
             )
             selection_window.destroy()
+            self.image_processor.reset_layout()
+            if self.main_session:
+                self.main_session.region = self.selected_region
+            if self.engine_process:
+                self.engine_process.configure(region=self.selected_region)
             self.deiconify()
             self._log(f"[🎯] Bölge kilitlendi: {self.selected_region}")
         
@@ -851,10 +3892,12 @@ class NexusSentenceMode(ctk.CTk):
             if not self.running:
                 self.running = True
                 try:
-                    self.overlay = SubtitleOverlay(self.config, self.current_theme)
+                    self.overlay = SubtitleOverlay(self.config, self.current_theme, scheduler=self.animation_scheduler)
+                    self._open_extra_overlays()
                     logger.info("Overlay penceresi açıldı")
                 except Exception as e:
                     logger.error(f"Overlay açma hatası: {e}", exc_info=True)
+                    self._destroy_overlays()
                     self.running = False
                     messagebox.showerror("❌ Hata", f"Overlay açılamadı: {e}")
                     return
@@ -866,15 +3909,41 @@ class NexusSentenceMode(ctk.CTk):
                     border_color="#ff006e"
                 )
                 self.status_label.configure(text="🔴 ÇALIŞIYOR", text_color="#ff006e")
-                self._log("[▶️] Çeviri motoru başlatıldı")
-                threading.Thread(target=self._process_loop, daemon=True).start()
+                self.output_sinks = OutputSinkManager(self._create_output_sinks())
+                if self.settings["engine_process"]:
+                    self.engine_process = EngineProcess(self.config)
+                    self.engine_process.start(self.selected_region, self.settings)
+                    self._log("[▶️] Çeviri motoru ayrı süreçte başlatıldı")
+                    self._poll_engine_process()
+                else:
+                    self._log("[▶️] Çeviri motoru başlatıldı")
+                    self.main_session = self.session_manager.start(
+                        "ana", self.selected_region, self.engine, self._handle_result,
+                        FrameRecorder.for_session(self.config, "ana") if self.settings["record_frames"] else None,
+                        self.capture_source
+                    )
+                self._start_extra_sessions()
             else:
                 self.running = False
-                if self.overlay:
-                    try:
-                        self.overlay.destroy()
-                    except:
-                        pass
+                logger.info(f"[OTURUM] {self.session_manager.report()}")
+                if not self.session_manager.stop_all():
+                    # Eski iş parçacığı hâlâ motorun içinde: bir sonraki başlatma aynı motoru paylaşmasın
+                    self.engine = self.session_manager.create_engine(self.settings, "ana")
+                    self.image_processor = self.engine.image_processor
+                self.main_session = None
+                for name, overlay in self.session_overlays.items():
+                    overlay.destroy()
+                self.session_overlays = {}
+                if self.engine_process:
+                    self.engine_process.stop()
+                    engine_metrics = self.engine_process.metrics
+                    logger.info(f"[MOTOR] süreç metrikleri={engine_metrics} yeniden başlatma={self.engine_process.restarts}")
+                    self.engine_process = None
+                else:
+                    engine_metrics = self.engine.report_metrics()
+                    logger.info(f"[MOTOR] metrikler={engine_metrics}")
+                logger.info(f"[SPEKÜLATİF] {TranslationEngine.speculation_report(engine_metrics)}")
+                self._destroy_overlays()
                 self.btn_start.configure(
                     text="▶ BAŞLAT",
                     fg_color="#ff006e",
@@ -883,85 +3952,308 @@ class NexusSentenceMode(ctk.CTk):
                 )
                 self.status_label.configure(text="🟢 İDLE", text_color="#00ff88")
                 self._log("[⏹️] Çeviri motoru durduruldu")
+                logger.info(f"[ANİMASYON] {self.animation_scheduler.report()}")
+                logger.info(f"[GECİKME] görünme→overlay {self.latency.report()}")
+                for report in self.output_sinks.close(self.config.output_close_timeout):
+                    logger.info(f"[ÇIKTI] {report}")
+                self._save_histories()
                 self._update_stats_display()
         except Exception as e:
             logger.error(f"Toggle translation hatası: {e}", exc_info=True)
     
-    def _process_loop(self) -> None:
-        """Ana işleme döngüsü (geliştirilmiş)"""
-        accumulated_text = ""
-        last_update_time = time.time()
-        error_count = 0
+    def _create_output_sinks(self) -> List[OutputSink]:
+        """Ayarlara göre etkin çıktı hedeflerini oluştur"""
+        sinks: List[OutputSink] = []
+        if self.settings["auto_copy"]:
+            # Eski satırları yazmaya devam etmek anlamsız: kuyruk küçük, en eski atılır
+            sinks.append(KeystrokeSink(self.config.keystroke_interval, max_queue=2, drop_policy="drop_oldest"))
+        if self.settings["copy_clipboard"]:
+            sinks.append(ClipboardSink(max_queue=4, drop_policy="drop_oldest"))
+        if self.settings["write_file"]:
+            sinks.append(FileTailSink(self.config.output_file_path, max_queue=self.config.output_queue_size, drop_policy="drop_newest"))
+        return sinks
+    
+    def _save_histories(self) -> None:
+        """Tüm geçmiş akışlarını kaydet (analitik toplamlar bir sonraki açılışta yeniden hesaplanmasın)"""
+        for history in [self.history, *self.extra_histories.values()]:
+            history.save()
+    
+    def _history_for(self, target_language: str) -> TranslationHistory:
+        """Hedef dilin geçmiş akışını döndür"""
+        if target_language == self.settings["target_language"]:
+            return self.history
+        if target_language not in self.extra_histories:
+            self.extra_histories[target_language] = TranslationHistory(f"{self.history_dir}_{target_language}", self.config.history_segment_max_entries)
+        return self.extra_histories[target_language]
+    
+    def _open_extra_overlays(self) -> None:
+        """Ek hedef diller için birincil overlay'in üstüne dizilmiş overlay'ler aç"""
+        # Geometride boyut veya konum yoksa ("800x100") birincil overlay'in gerçek penceresi kullanılır
+        self.overlay.update_idletasks()
+        match = re.fullmatch(r"(?:(\d+)x(\d+))?(?:\+(-?\d+)\+(-?\d+))?", self.config.overlay_geometry.strip())
+        width, height, x, y = match.groups() if match else (None, None, None, None)
+        width = int(width) if width else self.overlay.winfo_width()
+        height = int(height) if height else self.overlay.winfo_height()
+        x = int(x) if x is not None else self.overlay.winfo_x()
+        y = int(y) if y is not None else self.overlay.winfo_y()
+        for index, language in enumerate(self.settings["extra_target_languages"], 1):
+            geometry = f"{width}x{height}+{x}+{max(0, y - index * (height + 10))}"
+            self.extra_overlays[language] = SubtitleOverlay(self.config, self.current_theme, geometry, language, self.animation_scheduler)
+    
+    def _destroy_overlays(self) -> None:
+        """Birincil ve ek dil overlay'lerini kapat"""
+        for overlay in [self.overlay, *self.extra_overlays.values()]:
+            if overlay:
+                try:
+                    overlay.destroy()
+                except Exception:
+                    pass
+        self.overlay = None
+        self.extra_overlays = {}
+    
+    def _handle_result(self, result: Dict, name: str = "ana",
+                       overlays: Optional[Dict[str, SubtitleOverlay]] = None) -> None:
+        """Bir oturumun çeviri sonucunu overlay, geçmiş, yayın ve çıktı hedeflerine dağıt
         
-        try:
-            logger.info("İşleme döngüsü başladı")
+        overlays hedef dil → overlay eşlemesidir; verilmezse ana oturumun birincil ve ek dil overlay'leri kullanılır.
+        """
+        if overlays is None:
+            overlays = {self.settings["target_language"]: self.overlay, **self.extra_overlays}
+        text = result["original"]
+        source_language = result["source_language"]
+        cached = result.get("cached", {})
+        latency = time.time() - result["appeared_at"] if result.get("appeared_at") else None
+        
+        for target_language, translated in result["translations"].items():
+            if translated is None:
+                continue
+            primary = target_language == result["target_language"]
+            overlay = overlays.get(target_language)
+            if overlay and self.running:
+                overlay.update_text(translated)
             
-            while self.running:
-                try:
-                    # Ekran görüntüsünü yakala
-                    screenshot = pyautogui.screenshot(region=self.selected_region)
-                    
-                    # Görüntüyü OCR için hazırla
-                    processed = self.image_processor.prepare_for_ocr(screenshot, self.config)
-                    
-                    # Kontrast ayarını uygula
-                    enhancer = ImageEnhance.Contrast(processed)
-                    processed = enhancer.enhance(self.settings["contrast"])
-                    
-                    # Metin çıkart
-                    current_text = self.tesseract_mgr.extract_text(processed)
-                    
-                    # Metin değişti mi?
-                    if len(current_text) > 1 and current_text != accumulated_text:
-                        accumulated_text = current_text
-                        last_update_time = time.time()
-                    
-                    # Cümle bitti mi? (1 saniye metin değişmedi mi)
-                    elapsed = time.time() - last_update_time
-                    if accumulated_text and elapsed > self.config.sentence_pause_threshold:
-                        try:
-                            if self.translator:
-                                translated = self.translator.translate(accumulated_text)
-                                if self.overlay and self.running:
-                                    self.overlay.update_text(translated)
-                                self._log(f"✓ {translated}")
-                                self.history.add(accumulated_text, translated, f"{self.settings['source_language']}->{self.settings['target_language']}")
-                                self._update_stats_display()
-                                
-                                # Otomatik kopyala
-                                if self.settings["auto_copy"]:
-                                    try:
-                                        pyautogui.write(translated, interval=0.01)
-                                    except Exception as e:
-                                        logger.warning(f"Otomatik kopyala hatası: {e}")
-                        except Exception as e:
-                            logger.error(f"Çeviri hatası: {e}", exc_info=True)
-                            error_count += 1
-                        
-                        accumulated_text = ""
-                    
-                    time.sleep(self.settings["ocr_interval"])
-                    error_count = 0  # Başarılı olursa counter sıfırla
-                    
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"İşleme hatası ({error_count}): {e}", exc_info=True)
-                    
-                    if error_count > 10:
-                        logger.error("Çok fazla hata, işleme durduruldu")
-                        self.running = False
-                        break
-                    
-                    time.sleep(1)
+            # Metin zaten hedef dildeyse çevrilmeden aynen gösterilir; geçmiş, yayın ve çıktı hedefleri de
+            # overlay'de görüneni alır ("tr->tr" çifti çevrilmeden geçen satırı belirtir)
+            tags = [tag for tag in (name if name != "ana" else "", "" if primary else target_language) if tag]
+            self._log(f"✓ {''.join(f'[{tag}] ' for tag in tags)}{translated}")
+            self._history_for(target_language).add(text, translated, f"{source_language}->{target_language}",
+                                                   latency, cached.get(target_language, False))
+            if self.stream_server:
+                self.stream_server.publish(text, translated, f"{source_language}->{target_language}")
+            
+            # Çıktı hedefleri kendi iş parçacıklarında teslim eder (döngü beklemez)
+            if primary:
+                self.output_sinks.publish(translated, text, target_language)
         
-        except Exception as e:
-            logger.error(f"Process loop kritik hatası: {e}", exc_info=True)
-        finally:
-            logger.info("İşleme döngüsü sona erdi")
+        # Görünme → overlay gecikmesi (ve aynı cümle için eski süre kuralının tahmini)
+        if result.get("appeared_at"):
+            shown_at = time.time()
+            self.latency.add(f"yeni/{result['commit_reason']}", shown_at - result["appeared_at"])
+            if result["legacy_commit_at"] is not None:
+                legacy_shown_at = shown_at + max(0.0, result["legacy_commit_at"] - result["committed_at"])
+                self.latency.add("eski/süre", legacy_shown_at - result["appeared_at"])
+        
+        self._update_stats_display()
+    
+    def _poll_engine_process(self) -> None:
+        """Motor sürecinden gelen sonuçları ana iş parçacığında işle"""
+        if not self.running or not self.engine_process:
+            return
+        
+        for message in self.engine_process.poll():
+            if message["type"] == "result":
+                self._handle_result(message)
+            elif message["type"] == "restarted":
+                self._log(f"[⚠️] Motor süreci çöktü (kod={message['exit_code']}), yeniden başlatıldı", "WARNING")
+            elif message["type"] == "fatal":
+                self._log(f"[❌] Motor süreci durdu: {message['error']}", "ERROR")
+                self.toggle_translation()
+                return
+        
+        self.after(self.config.engine_poll_interval_ms, self._poll_engine_process)
+    
+    def _start_extra_sessions(self) -> None:
+        """Yapılandırmadaki ek yakalama oturumlarını kendi overlay'leriyle başlat"""
+        for index, spec in enumerate(self.config.capture_sessions, 1):
+            name = spec.get("name", f"oturum{index}")
+            settings = {
+                **self.settings,
+                "source_language": spec.get("source_language", self.settings["source_language"]),
+                "target_language": spec.get("target_language", self.settings["target_language"]),
+                "extra_target_languages": []
+            }
+            try:
+                overlay = SubtitleOverlay(
+                    self.config, self.current_theme,
+                    geometry=spec.get("overlay_geometry"),
+                    language=settings["target_language"],
+                    scheduler=self.animation_scheduler
+                )
+            except Exception as e:
+                logger.error(f"[{name}] Overlay açma hatası: {e}", exc_info=True)
+                continue
+            self.session_overlays[name] = overlay
+            overlays = {settings["target_language"]: overlay}
+            engine = self.session_manager.create_engine(settings, name)
+            self.session_manager.start(name, tuple(spec["region"]), engine,
+                                       lambda result, name=name, overlays=overlays: self._handle_result(result, name, overlays),
+                                       FrameRecorder.for_session(self.config, name) if self.settings["record_frames"] else None,
+                                       self.capture_source)
+            self._log(f"[▶️] Ek oturum başlatıldı: {name} {tuple(spec['region'])}")
+
+
+def tune_ocr(sample_dir: str, tessdata_dirs: List[str]) -> int:
+    """Örnek kareler üzerinde OCR profilini ayarla ve kaydet"""
+    config = AppConfig()
+    config.ocr_tessdata_candidates = list(config.ocr_tessdata_candidates) + tessdata_dirs
+    tesseract_mgr = TesseractManager(config)
+    samples = OCRBenchmark.load_samples(sample_dir)
+    logger.info(f"OCR ayarı: {len(samples)} örnek kare yüklendi")
+    
+    profile = OCRProfileTuner(config, tesseract_mgr).tune(samples)
+    if not profile:
+        return 1
+    
+    profile_path = AppConfig.save_ocr_profile(profile)
+    print(f"✓ OCR profili kaydedildi: {profile_path}")
+    return 0
+
+
+def run_benchmark(sample_dir: str) -> int:
+    """Ön işleme varyantlarının OCR süresi ve hata oranını karşılaştır"""
+    config = AppConfig()
+    config.load_ocr_profile()
+    config.ocr_auto_scale = True  # Ölçekli varyantlar profildeki sabit ölçeğe karşı kıyaslanır
+    tesseract_mgr = TesseractManager(config)
+    samples = OCRBenchmark.load_samples(sample_dir)
+    if not samples or not tesseract_mgr.available:
+        logger.error("Kıyaslama için örnek kare veya Tesseract yok")
+        return 1
+    
+    # Satır bölme denetimi: geniş bölgedeki tek kısa satır parçalanmamalı
+    try:
+        font = ImageFont.truetype("DejaVuSans.ttf", 28)
+    except OSError:
+        font = ImageFont.load_default()
+    probe = Image.new("L", (1200, 80), 255)
+    ImageDraw.Draw(probe).text((560, 20), "Yes.", fill=0, font=font)
+    crops = ImageProcessor.split_lines(probe)
+    print(f"satır bölme denetimi: geniş bölgede tek kısa satır → {len(crops)} parça {'✓' if len(crops) == 1 else '❌'}")
+    if len(crops) != 1:
+        return 1
+    
+    scaler = ImageProcessor()
+    
+    def native(image: Image.Image) -> str:
+        return tesseract_mgr.extract_text(ImageProcessor.prepare_for_ocr(image, config))
+    
+    def auto_scaled(image: Image.Image) -> str:
+        processed = ImageProcessor.prepare_for_ocr(image, config)
+        scaler.reset_layout()
+        return tesseract_mgr.extract_text(scaler.scale_for_ocr(processed, config))
+    
+    def color_keyed(image: Image.Image) -> str:
+        key = ImageProcessor.learn_color_key(image, config)
+        processed = ImageProcessor.color_key_mask(image, key, config) if key else ImageProcessor.prepare_for_ocr(image, config)
+        return tesseract_mgr.extract_text(processed)
+    
+    def color_keyed_scaled(image: Image.Image) -> str:
+        scaler.reset_layout()
+        scaler.learn_key(image, config)
+        processed = scaler.prepare(image, config, color_key=True)
+        return tesseract_mgr.extract_text(scaler.scale_for_ocr(processed, config))
+    
+    def parallel_lines(image: Image.Image) -> str:
+        scaler.reset_layout()
+        processed = scaler.scale_for_ocr(ImageProcessor.prepare_for_ocr(image, config), config)
+        return tesseract_mgr.extract_lines_parallel(ImageProcessor.split_lines(processed))
+    
+    variants = {
+        "native": native,
+        "auto_scale": auto_scaled,
+        "color_key": color_keyed,
+        "color_key+scale": color_keyed_scaled,
+        "parallel_lines": parallel_lines,
+    }
+    
+    print(f"{len(samples)} örnek kare, ortalama boyut: "
+          f"{sum(i.width for i, _ in samples) // len(samples)}x{sum(i.height for i, _ in samples) // len(samples)}")
+    baseline = None
+    for name, pipeline in variants.items():
+        metrics = OCRBenchmark.evaluate(samples, pipeline)
+        baseline = baseline or metrics
+        saved = baseline["latency_ms"] - metrics["latency_ms"]
+        print(f"{name:<16} {metrics['latency_ms']:8.1f} ms  CER={metrics['cer']:.3f}  kazanç={saved:+.1f} ms")
+    tesseract_mgr.shutdown()
+    return 0
+
+
+def run_soak(duration: float, cycles: int, frames_dir: Optional[str]) -> int:
+    """Dayanıklılık testini çalıştır"""
+    config = AppConfig()
+    config.load_ocr_profile()
+    return SoakTest(config, duration, cycles, frames_dir).run()
+
+
+def run_replay(path: str, realtime: bool) -> int:
+    """Kaydı ekran ve ağ olmadan ön işleme/OCR/cümle kuralından geçir"""
+    config = AppConfig()
+    config.load_ocr_profile()
+    if not TesseractManager(config).available:
+        logger.error("Tekrar oynatma için Tesseract gerekli")
+        return 1
+    
+    config.translate_requests_per_second = 0  # Yerel çevirmen: hız bütçesi gereksiz
+    
+    # Cümle kuralı kaydın zaman damgalarıyla işler: hızdan bağımsız, tekrarlanabilir sonuç
+    clock = {"now": 0.0}
+    engine = TranslationEngine(
+        config, TranslationEngine.default_settings(config),
+        translator_factory=lambda source, target: StubTranslator(source, target, 0.0),
+        clock=lambda: clock["now"]
+    )
+    started = time.perf_counter()
+    frames = commits = 0
+    try:
+        for timestamp, frame in FrameReplay(path).frames(realtime):
+            clock["now"] = timestamp
+            result = engine.step(frame)
+            frames += 1
+            if result:
+                commits += 1
+                print(f"[{timestamp:8.2f} sn] {result['commit_reason']:<10} {result['original']!r}")
+    finally:
+        engine.shutdown()
+    
+    elapsed = time.perf_counter() - started
+    metrics = engine.metrics
+    print(f"{frames} kare, {commits} cümle, {elapsed:.2f} sn "
+          f"(OCR ort {metrics['ocr_time'] / max(frames, 1) * 1000:.1f} ms/kare)")
+    return 0
 
 
 def main():
     """Uygulamayı çalıştır"""
+    parser = argparse.ArgumentParser(description="NEXUS PRIME - Akıllı Ekran Okuma ve Çeviri Aracı")
+    parser.add_argument("--tune-ocr", metavar="DIZIN", help="Etiketli örnek karelerle OCR profilini ayarla (kare.png + kare.txt)")
+    parser.add_argument("--tessdata", metavar="DIZIN", action="append", default=[], help="Ayar sırasında denenecek ek tessdata dizini")
+    parser.add_argument("--bench", metavar="DIZIN", help="Etiketli örnek karelerle ön işleme varyantlarını kıyasla")
+    parser.add_argument("--soak", metavar="SANIYE", type=float, help="Yerel çevirmenle dayanıklılık (bellek/gecikme kayması) testi")
+    parser.add_argument("--soak-cycles", metavar="N", type=int, default=4, help="Dayanıklılık testindeki başlat/durdur döngüsü sayısı")
+    parser.add_argument("--soak-frames", metavar="DIZIN", help="Sentetik kareler yerine tekrar oynatılacak kare dizini veya .nxrec kaydı")
+    parser.add_argument("--replay", metavar="KAYIT", help="Kaydedilmiş kareleri (.nxrec) OCR/cümle hattından geçir")
+    parser.add_argument("--replay-speed", choices=("original", "max"), default="max", help="Tekrar oynatma hızı")
+    args = parser.parse_args()
+    
+    if args.tune_ocr:
+        sys.exit(tune_ocr(args.tune_ocr, args.tessdata))
+    if args.bench:
+        sys.exit(run_benchmark(args.bench))
+    if args.replay:
+        sys.exit(run_replay(args.replay, args.replay_speed == "original"))
+    if args.soak is not None:
+        sys.exit(run_soak(args.soak, args.soak_cycles, args.soak_frames))
+    
     try:
         logger.info("=" * 50)
         logger.info("NEXUS PRIME v17.0 Başlatılıyor...")